@@ -2,17 +2,9 @@
 from __future__ import annotations
 
 import os
-import json
-import io
-import zipfile
-import shutil
-import inspect
 from datetime import datetime, timezone
-from pathlib import Path
 
-import pandas as pd
 import streamlit as st
-import streamlit.components.v1 as components
 
 
 # ============================================================
@@ -29,82 +21,9 @@ st.set_page_config(page_title=BRAND_NAME, layout="wide")
 
 
 # ============================================================
-# Optional feature imports (do NOT crash if missing)
+# Required local pipeline modules (fail fast with a clear error)
 # ============================================================
-render_sla_escalations = None
-IssueTrackerStore = None
-
-build_customer_impact_view = None
-render_customer_impact_view = None
-
-render_customer_comms_ui = None
-render_comms_pack_download = None
-
-build_daily_action_list = None
-render_daily_action_list = None
-
-render_kpi_trends = None
-
-build_supplier_accountability_view = None
-render_supplier_accountability = None
-
-# Optional UI/components
-try:
-    from ui.sla_escalations_ui import render_sla_escalations  # type: ignore
-except Exception:
-    render_sla_escalations = None
-
-try:
-    from core.issue_tracker import IssueTrackerStore  # type: ignore
-except Exception:
-    IssueTrackerStore = None
-
-try:
-    from core.customer_impact import build_customer_impact_view  # type: ignore
-except Exception:
-    build_customer_impact_view = None
-
-try:
-    from ui.customer_impact_ui import render_customer_impact_view  # type: ignore
-except Exception:
-    render_customer_impact_view = None
-
-try:
-    from ui.customer_comms_ui import render_customer_comms_ui  # type: ignore
-except Exception:
-    render_customer_comms_ui = None
-
-try:
-    from ui.comms_pack_ui import render_comms_pack_download  # type: ignore
-except Exception:
-    render_comms_pack_download = None
-
-try:
-    from core.actions import build_daily_action_list  # type: ignore
-except Exception:
-    build_daily_action_list = None
-
-try:
-    from ui.actions_ui import render_daily_action_list  # type: ignore
-except Exception:
-    render_daily_action_list = None
-
-try:
-    from ui.kpi_trends_ui import render_kpi_trends  # type: ignore
-except Exception:
-    render_kpi_trends = None
-
-try:
-    from core.supplier_accountability import build_supplier_accountability_view  # type: ignore
-except Exception:
-    build_supplier_accountability_view = None
-
-try:
-    from ui.supplier_accountability_ui import render_supplier_accountability  # type: ignore
-except Exception:
-    render_supplier_accountability = None
-
-# Local pipeline modules
+# Optional features are resolved lazily by ui.app_shell; nothing else is imported here.
 try:
     from normalize import normalize_orders, normalize_shipments, normalize_tracking  # noqa: F401
     from reconcile import reconcile_all  # noqa: F401
@@ -117,50 +36,6 @@ except Exception as e:
     st.stop()
 
 
-# ============================================================
-# Helpers (unchanged)
-# ============================================================
-def copy_button(text: str, label: str, key: str):
-    safe_text = (
-        str(text)
-        .replace("\\", "\\\\")
-        .replace("`", "\\`")
-        .replace("${", "\\${")
-    )
-    html = f"""
-    <div style="margin: 0.25rem 0;">
-      <button
-        id="btn-{key}"
-        style="
-          padding: 0.45rem 0.75rem;
-          border-radius: 0.5rem;
-          border: 1px solid rgba(49, 51, 63, 0.2);
-          background: white;
-          cursor: pointer;
-          font-size: 0.9rem;
-        "
-        onclick="navigator.clipboard.writeText(`{safe_text}`)
-          .then(() => {{
-            const b = document.getElementById('btn-{key}');
-            const old = b.innerText;
-            b.innerText = 'Copied ✅';
-            setTimeout(() => b.innerText = old, 1200);
-          }})
-          .catch(() => alert('Copy failed. Your browser may block clipboard access.'));"
-      >
-        {label}
-      </button>
-    </div>
-    """
-    components.html(html, height=55)
-
-
-def call_with_accepted_kwargs(fn, **kwargs):
-    sig = inspect.signature(fn)
-    accepted = {k: v for k, v in kwargs.items() if k in sig.parameters}
-    return fn(**accepted)
-
-
 # -------------------------------
 # Access gate (keep behavior)
 # -------------------------------
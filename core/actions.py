@@ -1,6 +1,27 @@
 # core/actions.py
+import re
+from typing import Callable
+
 import pandas as pd
 
+# Compiled once at import; reused by every build_daily_action_list call.
+_CUSTOMER_PAIN_RE = re.compile(
+    r"late|overdue|past due|missing tracking|no tracking|exception|lost|stuck|returned"
+)
+
+# Display columns per action list (kept in this order when present)
+_CUST_COLS = (
+    "Urgency", "order_id", "sku", "supplier_name", "customer_country",
+    "issue_type", "line_status", "explanation", "next_action", "customer_risk",
+)
+_SUPP_COLS = ("supplier_name", "supplier_email", "item_count", "order_ids", "urgency", "worst_escalation", "subject")
+_WATCH_COLS = ("Urgency", "order_id", "sku", "supplier_name", "issue_type", "line_status", "next_action")
+
+# Ordered worst-last so a descending sort puts the worst escalations on top.
+_ESCALATION_DTYPE = pd.CategoricalDtype(
+    ["On Track", "At Risk (72h)", "Reminder", "Firm Follow-up", "Escalate"], ordered=True
+)
+
 
 def _series(df: pd.DataFrame, col: str, default: str = "") -> pd.Series:
     """
@@ -9,10 +30,47 @@ def _series(df: pd.DataFrame, col: str, default: str = "") -> pd.Series:
     if df is None or df.empty:
         return pd.Series([], dtype="object")
     if col in df.columns:
-        return df[col].astype(str).fillna("")
+        s = df[col]
+        if pd.api.types.is_string_dtype(s):
+            # Already text: skip the astype(str) copy
+            return s.fillna("") if s.hasnans else s
+        return s.astype(str).fillna("")
     return pd.Series([default] * len(df), index=df.index, dtype="object")
 
 
+def _to_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Display-only frames: store pure-text object columns as Arrow-backed strings so
+    st.dataframe / search don't re-convert them on every rerun. Best-effort (needs pyarrow).
+    """
+    if df is None or df.empty:
+        return df
+    try:
+        text_cols = [
+            c for c in df.columns
+            if df[c].dtype == object and pd.api.types.infer_dtype(df[c], skipna=True) == "string"
+        ]
+        if text_cols:
+            return df.astype({c: "string[pyarrow]" for c in text_cols})
+    except Exception:
+        pass
+    return df
+
+
+def _maybe_cache_data(func: Callable):
+    """
+    Optional Streamlit caching. If Streamlit isn't available (tests/CLI),
+    this becomes a no-op decorator.
+    """
+    try:
+        import streamlit as st  # type: ignore
+
+        return st.cache_data(show_spinner=False)(func)
+    except Exception:
+        return func
+
+
+@_maybe_cache_data
 def build_daily_action_list(
     exceptions: pd.DataFrame,
     followups: pd.DataFrame,
@@ -26,37 +84,35 @@ def build_daily_action_list(
       - watchlist (DataFrame)
       - summary (dict)
     """
-    exc = exceptions.copy() if exceptions is not None else pd.DataFrame()
-    fu = followups.copy() if followups is not None else pd.DataFrame()
+    # Read-only below: every output is a fresh slice/projection, so no defensive copies of the inputs
+    exc = exceptions if exceptions is not None else pd.DataFrame()
+    fu = followups if followups is not None else pd.DataFrame()
+
+    has_exc = not exc.empty
+    exc_cols = set(exc.columns)  # one set, shared by the customer + watchlist projections
+
+    # Shared by customer actions + watchlist
+    urgency = _series(exc, "Urgency") if has_exc else pd.Series([], dtype="object")  # safe even if missing
 
     # ---------- Customer actions (from exceptions) ----------
     customer_actions = pd.DataFrame()
 
-    if exc is not None and not exc.empty:
+    if has_exc:
         issue_type = _series(exc, "issue_type")
         explanation = _series(exc, "explanation")
         next_action = _series(exc, "next_action")
         line_status = _series(exc, "line_status")
-        urgency = _series(exc, "Urgency")  # safe even if missing
 
-        blob = (issue_type + " " + explanation + " " + next_action + " " + line_status).str.lower()
+        blob = issue_type.str.cat([explanation, next_action, line_status], sep=" ", na_rep="").str.lower()
 
         is_urgent = urgency.isin(["Critical", "High"])
-        is_customer_pain = blob.str.contains(
-            "late|overdue|past due|missing tracking|no tracking|exception|lost|stuck|returned",
-            regex=True,
-            na=False,
-        )
+        is_customer_pain = blob.str.contains(_CUSTOMER_PAIN_RE, na=False)
 
-        customer_actions = exc[is_urgent | is_customer_pain].copy()
+        keep = [c for c in _CUST_COLS if c in exc_cols]
 
-        keep = [c for c in [
-            "Urgency", "order_id", "sku", "supplier_name", "customer_country",
-            "issue_type", "line_status", "explanation", "next_action", "customer_risk"
-        ] if c in customer_actions.columns]
-
-        if keep:
-            customer_actions = customer_actions[keep]
+        # Select rows + display columns in one .loc so only the narrow frame is materialized
+        mask = (is_urgent | is_customer_pain).to_numpy()
+        customer_actions = exc.loc[mask, keep if keep else list(exc.columns)]
 
         # best-effort sort
         sort_cols = [c for c in ["Urgency", "customer_risk", "order_id"] if c in customer_actions.columns]
@@ -68,46 +124,45 @@ def build_daily_action_list(
     # ---------- Supplier actions (from followups) ----------
     supplier_actions = pd.DataFrame()
 
-    if fu is not None and not fu.empty:
-        keep = [c for c in ["supplier_name", "supplier_email", "item_count", "order_ids", "urgency", "worst_escalation", "subject"] if c in fu.columns]
-        supplier_actions = fu[keep].copy() if keep else fu.copy()
-
-        # sort: item_count desc if exists
-        if "item_count" in supplier_actions.columns:
-            try:
-                supplier_actions["_ic"] = pd.to_numeric(supplier_actions["item_count"], errors="coerce").fillna(0)
-                supplier_actions = supplier_actions.sort_values("_ic", ascending=False).drop(columns=["_ic"])
-            except Exception:
-                pass
-
-        # If SLA escalation exists, push worse escalations to top
-        if "worst_escalation" in supplier_actions.columns:
-            rank = {"Escalate": 4, "Firm Follow-up": 3, "Reminder": 2, "At Risk (72h)": 1, "On Track": 0}
-            try:
-                supplier_actions["_er"] = supplier_actions["worst_escalation"].astype(str).map(rank).fillna(0)
-                supplier_actions = supplier_actions.sort_values(["_er"], ascending=False).drop(columns=["_er"])
-            except Exception:
-                pass
+    if not fu.empty:
+        fu_cols = set(fu.columns)
+        keep = [c for c in _SUPP_COLS if c in fu_cols]
+        supplier_actions = fu[keep] if keep else fu.copy()
+
+        # Top-N by (escalation desc, item_count desc): partial selection instead of two full sorts.
+        # Keys live in a side frame (positional) so the output columns are untouched.
+        try:
+            sort_key = pd.DataFrame(index=pd.RangeIndex(len(supplier_actions)))
+            if "worst_escalation" in supplier_actions.columns:
+                # Ordered categorical codes; unknown/NaN labels (code -1) rank as "On Track" (0), as before
+                esc = supplier_actions["worst_escalation"].astype(str).astype(_ESCALATION_DTYPE)
+                sort_key["_esc"] = esc.cat.codes.clip(lower=0).to_numpy()
+            if "item_count" in supplier_actions.columns:
+                ic = pd.to_numeric(supplier_actions["item_count"], errors="coerce").fillna(0)
+                sort_key["_ic"] = ic.to_numpy()
+            if len(sort_key.columns):
+                top = sort_key.nlargest(int(max_items), list(sort_key.columns), keep="first").index
+                supplier_actions = supplier_actions.iloc[top.to_numpy()]
+        except Exception:
+            pass
 
         supplier_actions = supplier_actions.head(int(max_items))
 
     # ---------- Watchlist (medium urgency exceptions) ----------
     watchlist = pd.DataFrame()
-    if exc is not None and not exc.empty:
-        urgency = _series(exc, "Urgency")
-        watch_mask = urgency.isin(["Medium"])
-        watchlist = exc[watch_mask].copy()
+    if has_exc:
+        watch_mask = urgency.eq("Medium").to_numpy()
 
-        keep = [c for c in [
-            "Urgency", "order_id", "sku", "supplier_name",
-            "issue_type", "line_status", "next_action"
-        ] if c in watchlist.columns]
+        keep = [c for c in _WATCH_COLS if c in exc_cols]
 
-        if keep:
-            watchlist = watchlist[keep]
+        watchlist = exc.loc[watch_mask, keep if keep else list(exc.columns)]
 
         watchlist = watchlist.head(int(max_items))
 
+    customer_actions = _to_arrow_strings(customer_actions)
+    supplier_actions = _to_arrow_strings(supplier_actions)
+    watchlist = _to_arrow_strings(watchlist)
+
     # ---------- Summary ----------
     summary = {
         "customer_actions": int(len(customer_actions)) if customer_actions is not None else 0,
@@ -33,7 +33,7 @@ def make_comms_pack_bytes(
     with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
         # Supplier emails
         if followups is not None and not followups.empty:
-            f = followups.copy().head(int(max_supplier))
+            f = followups.head(int(max_supplier))
             if "supplier_name" in f.columns and "body" in f.columns:
                 for i, r in f.iterrows():
                     sname = str(r.get("supplier_name", "supplier")).strip()
@@ -47,7 +47,7 @@ def make_comms_pack_bytes(
 
         # Customer emails
         if customer_impact is not None and not customer_impact.empty:
-            c = customer_impact.copy().head(int(max_customer))
+            c = customer_impact.head(int(max_customer))
             if "customer_message_draft" in c.columns:
                 for i, r in c.iterrows():
                     order_id = str(r.get("order_id", "")).strip()
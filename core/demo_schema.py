@@ -48,6 +48,44 @@ OPTIONAL_SHIPMENTS_COLS = [
 
 REQUIRED_TRACKING_COLS = []  # Tracking is optional for demo
 
+# Explicit read dtypes for the raw CSVs (demo files + uploads in the same shape).
+# Identifier/text columns are read as str so pandas skips type inference on them
+# and ids like tracking numbers keep their leading zeros. Numeric columns are left
+# to inference so bad values are reported by validate_demo_inputs instead of
+# failing the read. pd.read_csv ignores keys that are not present in a file.
+ORDERS_DTYPES: Dict[str, type] = {
+    "Name": str,
+    "Created at": str,
+    "Lineitem sku": str,
+    "Shipping country": str,
+    "Shipping province": str,
+    "Currency": str,
+    "Shipping method": str,
+}
+
+SHIPMENTS_DTYPES: Dict[str, type] = {
+    "Supplier": str,
+    "Supplier Order ID": str,
+    "Order ID": str,
+    "SKU": str,
+    "Ship Date": str,
+    "Carrier": str,
+    "Tracking": str,
+    "From Country": str,
+    "To Country": str,
+}
+
+TRACKING_DTYPES: Dict[str, type] = {
+    "Carrier": str,
+    "Tracking Number": str,
+    "Order ID": str,
+    "Supplier Order ID": str,
+    "Status": str,
+    "Last Update": str,
+    "Delivered At": str,
+    "Exception": str,
+}
+
 
 def _missing_cols(df: pd.DataFrame, required: List[str]) -> List[str]:
     cols = set(df.columns.tolist()) if isinstance(df, pd.DataFrame) else set()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -219,12 +220,20 @@ class IssueTrackerStore:
         Timeline is stored beside issue_tracker.json: <ws_root>/timeline.jsonl
         """
         try:
-            from core.timeline_store import TimelineStore, timeline_path_for_issue_tracker_path
+            from core.timeline_store import timeline_store_for, timeline_path_for_issue_tracker_path
 
-            return TimelineStore(timeline_path_for_issue_tracker_path(self.path))
+            return timeline_store_for(str(timeline_path_for_issue_tracker_path(self.path)))
         except Exception:
             return None
 
+    def timeline_batch(self):
+        """
+        Context manager: timeline events logged inside the block are appended in one write.
+        No-op if the timeline is unavailable.
+        """
+        tl = self._timeline()
+        return tl.batched() if tl is not None else nullcontext()
+
     def _log_event(
         self,
         *args,
@@ -301,9 +310,28 @@ class IssueTrackerStore:
         except Exception:
             return {}
 
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Read-only view of load(): the parsed map is reused until the file's mtime/size
+        changes (our own saves included), so render paths that only look records up
+        don't re-parse the JSON every rerun. Callers must not mutate the result.
+        """
+        try:
+            st_ = self.path.stat()
+            sig = (st_.st_mtime_ns, st_.st_size)
+        except OSError:
+            return {}
+        cached = getattr(self, "_snapshot", None)
+        if cached is not None and cached[0] == sig:
+            return cached[1]
+        data = self.load()
+        self._snapshot = (sig, data)
+        return data
+
     def save(self, data: Dict[str, Dict[str, Any]]) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self.path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        self._snapshot = None
 
     # ----------------------------
     # Core mutations (existing)
@@ -1,26 +1,43 @@
 # core/paths.py
+import os
+import stat
 from pathlib import Path
 import streamlit as st
 
+
+def _is_dir(path: Path):
+    """
+    One stat() per path: True (folder), False (exists, not a folder), None (missing).
+    """
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return None
+
+
 def init_paths(base_dir: Path):
     data_dir = base_dir / "data"
 
     workspaces_dir = data_dir / "workspaces"
-    if workspaces_dir.exists() and not workspaces_dir.is_dir():
+    ws_is_dir = _is_dir(workspaces_dir)
+    if ws_is_dir is False:
         st.error(
             "Workspace storage path is invalid: `data/workspaces` exists but is a FILE, not a folder.\n\n"
             "Fix: delete or rename `data/workspaces` in your repo, then redeploy."
         )
         st.stop()
-    workspaces_dir.mkdir(parents=True, exist_ok=True)
+    if ws_is_dir is None:
+        workspaces_dir.mkdir(parents=True, exist_ok=True)
 
     suppliers_dir = data_dir / "suppliers"
-    if suppliers_dir.exists() and not suppliers_dir.is_dir():
+    sup_is_dir = _is_dir(suppliers_dir)
+    if sup_is_dir is False:
         st.error(
             "Supplier storage path is invalid: `data/suppliers` exists but is a FILE, not a folder.\n\n"
             "Fix: delete or rename `data/suppliers` in your repo, then redeploy."
         )
         st.stop()
-    suppliers_dir.mkdir(parents=True, exist_ok=True)
+    if sup_is_dir is None:
+        suppliers_dir.mkdir(parents=True, exist_ok=True)
 
     return base_dir, data_dir, workspaces_dir, suppliers_dir
@@ -1,8 +1,10 @@
 # core/styling.py
 from __future__ import annotations
 
+import re
+
+import numpy as np
 import pandas as pd
-import streamlit.components.v1 as components
 
 
 def copy_button(text: str, label: str, key: str):
@@ -37,9 +39,39 @@ def copy_button(text: str, label: str, key: str):
       </button>
     </div>
     """
+    # Imported here: the pipeline loads this module for add_urgency_column / table styling,
+    # which never need the components API.
+    import streamlit.components.v1 as components
+
     components.html(html, height=55)
 
 
+_URGENCY_TEXT_COLS = ["issue_type", "explanation", "next_action", "customer_risk", "line_status"]
+
+_CRITICAL_TERMS = [
+    "late", "past due", "overdue", "late unshipped",
+    "missing tracking", "no tracking", "tracking missing",
+    "carrier exception", "exception", "lost", "stuck", "seized",
+    "returned to sender", "address missing", "missing address",
+]
+_HIGH_TERMS = [
+    "partial", "partial shipment",
+    "mismatch", "quantity mismatch",
+    "invalid tracking", "tracking invalid",
+    "carrier unknown", "unknown carrier",
+]
+_MEDIUM_TERMS = ["verify", "check", "confirm", "format", "invalid", "missing", "contact"]
+
+
+def _terms_re(terms: list[str]) -> re.Pattern:
+    return re.compile("|".join(re.escape(t) for t in terms))
+
+
+_CRITICAL_RE = _terms_re(_CRITICAL_TERMS)
+_HIGH_RE = _terms_re(_HIGH_TERMS)
+_MEDIUM_RE = _terms_re(_MEDIUM_TERMS)
+
+
 def add_urgency_column(exceptions_df: pd.DataFrame) -> pd.DataFrame:
     """
     Adds an ordered categorical Urgency column:
@@ -50,47 +82,41 @@ def add_urgency_column(exceptions_df: pd.DataFrame) -> pd.DataFrame:
 
     df = exceptions_df.copy()
 
-    def classify_row(row) -> str:
-        issue_type = str(row.get("issue_type", "")).lower()
-        explanation = str(row.get("explanation", "")).lower()
-        next_action = str(row.get("next_action", "")).lower()
-        risk = str(row.get("customer_risk", "")).lower()
-        line_status = str(row.get("line_status", "")).lower()
-        blob = " ".join([issue_type, explanation, next_action, risk, line_status])
-
-        critical_terms = [
-            "late", "past due", "overdue", "late unshipped",
-            "missing tracking", "no tracking", "tracking missing",
-            "carrier exception", "exception", "lost", "stuck", "seized",
-            "returned to sender", "address missing", "missing address",
-        ]
-        if any(t in blob for t in critical_terms):
-            return "Critical"
-
-        high_terms = [
-            "partial", "partial shipment",
-            "mismatch", "quantity mismatch",
-            "invalid tracking", "tracking invalid",
-            "carrier unknown", "unknown carrier",
-        ]
-        if any(t in blob for t in high_terms):
-            return "High"
-
-        medium_terms = ["verify", "check", "confirm", "format", "invalid", "missing", "contact"]
-        if any(t in blob for t in medium_terms):
-            return "Medium"
-
-        return "Low"
-
-    df["Urgency"] = df.apply(classify_row, axis=1)
+    # Same text blob the old per-row classifier built, but as whole-column string ops
+    parts = [
+        df[c].astype(str) if c in df.columns else pd.Series("", index=df.index)
+        for c in _URGENCY_TEXT_COLS
+    ]
+    # na_rep: a missing value in one column must not blank the whole blob (pandas 3 keeps NaN
+    # through astype(str)); the old per-row str() produced "nan", which matches no term either.
+    blob = parts[0].str.cat(parts[1:], sep=" ", na_rep="").str.lower()
+
+    urgency = np.select(
+        [
+            blob.str.contains(_CRITICAL_RE, na=False).to_numpy(dtype=bool),
+            blob.str.contains(_HIGH_RE, na=False).to_numpy(dtype=bool),
+            blob.str.contains(_MEDIUM_RE, na=False).to_numpy(dtype=bool),
+        ],
+        ["Critical", "High", "Medium"],
+        default="Low",
+    )
     df["Urgency"] = pd.Categorical(
-        df["Urgency"],
+        urgency,
         categories=["Critical", "High", "Medium", "Low"],
         ordered=True,
     )
     return df
 
 
+def _row_css_frame(frame: pd.DataFrame, css: pd.Series) -> pd.DataFrame:
+    """
+    Broadcast one CSS string per row across every column, for Styler.apply(axis=None).
+    Replaces a Python callback per row with a single vectorized pass.
+    """
+    values = np.repeat(css.to_numpy(dtype=object)[:, None], frame.shape[1], axis=1)
+    return pd.DataFrame(values, index=frame.index, columns=frame.columns)
+
+
 def style_exceptions_table(df: pd.DataFrame):
     """
     Row-highlights exceptions by Urgency.
@@ -105,11 +131,11 @@ def style_exceptions_table(df: pd.DataFrame):
         "Low": ""
     }
 
-    def row_style(row):
-        u = str(row.get("Urgency", "Low"))
-        return [colors.get(u, "")] * len(row)
+    def row_style(frame: pd.DataFrame) -> pd.DataFrame:
+        css = frame["Urgency"].astype(str).map(colors).fillna("")
+        return _row_css_frame(frame, css)
 
-    return df.style.apply(row_style, axis=1)
+    return df.style.apply(row_style, axis=None)
 
 
 def style_supplier_table(df: pd.DataFrame):
@@ -119,10 +145,12 @@ def style_supplier_table(df: pd.DataFrame):
     if df is None or df.empty or "supplier_email" not in df.columns:
         return df.style if isinstance(df, pd.DataFrame) else pd.DataFrame().style
 
-    def _row_style(row):
-        email = str(row.get("supplier_email", "")).strip()
-        if email == "" or email.lower() in ["nan", "none"]:
-            return ["background-color: #fff1cc;"] * len(row)
-        return [""] * len(row)
+    def _row_style(frame: pd.DataFrame) -> pd.DataFrame:
+        raw = frame["supplier_email"]
+        # isna() first: pandas 3 keeps NaN through astype(str), where str(NaN) used to give "nan"
+        email = raw.fillna("").astype(str).str.strip()
+        missing = raw.isna() | email.eq("") | email.str.lower().isin(["nan", "none"])
+        css = pd.Series(np.where(missing.to_numpy(), "background-color: #fff1cc;", ""), index=frame.index)
+        return _row_css_frame(frame, css)
 
-    return df.style.apply(_row_style, axis=1)
+    return df.style.apply(_row_style, axis=None)
@@ -7,6 +7,16 @@ import pandas as pd
 from core.workspaces import safe_slug
 
 
+# Supplier Directory columns are all free text; read them as str (no inference).
+SUPPLIERS_DTYPES: dict[str, type] = {
+    "supplier_name": str,
+    "supplier_email": str,
+    "supplier_channel": str,
+    "language": str,
+    "timezone": str,
+}
+
+
 def normalize_supplier_key(s: str) -> str:
     return (str(s) if s is not None else "").strip().lower()
 
@@ -19,7 +29,7 @@ def load_suppliers(suppliers_dir: Path, account_id: str, store_id: str) -> pd.Da
     p = suppliers_path(suppliers_dir, account_id, store_id)
     if p.exists():
         try:
-            return pd.read_csv(p)
+            return pd.read_csv(p, dtype=SUPPLIERS_DTYPES)
         except Exception:
             return pd.DataFrame()
     return pd.DataFrame()
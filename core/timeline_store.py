@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import json
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from uuid import uuid4
 
 
@@ -70,6 +73,8 @@ class TimelineStore:
 
     def __init__(self, path: str | Path):
         self.path = Path(path)
+        # Per-thread pending lines while inside batched(); the store is shared across sessions
+        self._local = threading.local()
 
     def append(self, event: Dict[str, Any]) -> None:
         """
@@ -77,14 +82,42 @@ class TimelineStore:
         Never raises to callers (timeline must never break app).
         """
         try:
-            self.path.parent.mkdir(parents=True, exist_ok=True)
-            line = json.dumps(event, ensure_ascii=False)
-            with self.path.open("a", encoding="utf-8") as f:
-                f.write(line + "\n")
+            line = json.dumps(event, ensure_ascii=False) + "\n"
+            pending = getattr(self._local, "pending", None)
+            if pending is not None:
+                pending.append(line)
+                return
+            self._write_lines([line])
         except Exception:
             # Intentionally swallow errors
             return
 
+    @contextmanager
+    def batched(self) -> Iterator["TimelineStore"]:
+        """
+        Buffer appends made inside the block (this thread only) and write them with a single
+        open/write on exit, e.g. around a bulk "Save changes" loop. Nested blocks join the outer one.
+        """
+        if getattr(self._local, "pending", None) is not None:
+            yield self
+            return
+        self._local.pending = []
+        try:
+            yield self
+        finally:
+            lines, self._local.pending = self._local.pending, None
+            try:
+                self._write_lines(lines)
+            except Exception:
+                pass
+
+    def _write_lines(self, lines: List[str]) -> None:
+        if not lines:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write("".join(lines))
+
     def log(
         self,
         *,
@@ -114,3 +147,11 @@ class TimelineStore:
             data=data or {},
         )
         self.append(ev.as_dict())
+
+
+@lru_cache(maxsize=64)
+def timeline_store_for(path_str: str) -> TimelineStore:
+    """
+    Shared TimelineStore per timeline file (the store is stateless beyond its path).
+    """
+    return TimelineStore(path_str)
@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# Tests import the app's packages (core/, ui/) from the repo root, like `streamlit run app.py` does.
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
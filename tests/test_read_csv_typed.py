@@ -0,0 +1,48 @@
+import io
+
+import pandas as pd
+import pytest
+
+from core.demo_schema import SHIPMENTS_DTYPES
+from ui import app_helpers
+from ui.app_helpers import read_csv_chunked, read_csv_typed
+
+CSV = (
+    "Supplier,Supplier Order ID,Order ID,SKU,Quantity,Ship Date,Carrier,Tracking,From Country,To Country\n"
+    "Acme,PO-1,00123,0042,2,2024-01-02,USPS,9400111899223817412345,CN,US\n"
+    "Acme,PO-2,00124,0043,1,2024-01-03,USPS,9400111899223817412346,CN,US\n"
+)
+
+
+def _check_ids(df: pd.DataFrame) -> None:
+    assert df["Order ID"].tolist() == ["00123", "00124"]
+    assert df["SKU"].tolist() == ["0042", "0043"]
+    assert df["Tracking"].tolist() == ["9400111899223817412345", "9400111899223817412346"]
+    assert df["Tracking"].nunique() == 2
+
+
+@pytest.mark.parametrize("has_pyarrow", [True, False])
+def test_read_csv_typed_keeps_text_ids(monkeypatch, has_pyarrow):
+    if has_pyarrow:
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(app_helpers, "_HAS_PYARROW", has_pyarrow)
+    _check_ids(read_csv_typed(io.BytesIO(CSV.encode("utf-8")), SHIPMENTS_DTYPES))
+
+
+def test_typed_and_chunked_reads_agree():
+    typed = read_csv_typed(io.BytesIO(CSV.encode("utf-8")), SHIPMENTS_DTYPES)
+    chunked = read_csv_chunked(io.BytesIO(CSV.encode("utf-8")), SHIPMENTS_DTYPES, chunksize=1)
+    _check_ids(chunked)
+    for col in SHIPMENTS_DTYPES:
+        assert typed[col].tolist() == chunked[col].tolist()
+
+
+@pytest.mark.parametrize("max_rows, warned, kept", [(2, False, 2), (1, True, 1), (5, False, 2)])
+def test_read_csv_upload_warns_only_when_truncated(monkeypatch, max_rows, warned, kept):
+    warnings = []
+    monkeypatch.setattr(app_helpers.st, "warning", warnings.append)
+    df = app_helpers.read_csv_upload(
+        io.BytesIO(CSV.encode("utf-8")), SHIPMENTS_DTYPES, row_filter=lambda d: d, max_rows=max_rows
+    )
+    assert len(df) == kept
+    assert bool(warnings) is warned
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+from core.styling import _CRITICAL_TERMS, _HIGH_TERMS, _MEDIUM_TERMS, add_urgency_column
+
+
+def _baseline_urgency(row) -> str:
+    # The original per-row classifier (str() of every field, missing columns -> "")
+    blob = " ".join(
+        str(row.get(c, "")).lower()
+        for c in ("issue_type", "explanation", "next_action", "customer_risk", "line_status")
+    )
+    for label, terms in (("Critical", _CRITICAL_TERMS), ("High", _HIGH_TERMS), ("Medium", _MEDIUM_TERMS)):
+        if any(t in blob for t in terms):
+            return label
+    return "Low"
+
+
+def test_add_urgency_column_matches_baseline_with_missing_values():
+    df = pd.DataFrame(
+        {
+            "issue_type": ["late", np.nan, "partial", None, "ok", np.nan],
+            "explanation": [np.nan, "Tracking Missing", np.nan, "please verify", None, np.nan],
+            "next_action": ["", None, "ship rest", np.nan, "none", np.nan],
+            "customer_risk": [np.nan, np.nan, None, "", "low", np.nan],
+            # line_status deliberately absent
+        }
+    )
+    out = add_urgency_column(df)
+    expected = [_baseline_urgency(r) for _, r in df.iterrows()]
+    assert out["Urgency"].astype(str).tolist() == expected
+    assert expected[:4] == ["Critical", "Critical", "High", "Medium"]
+
+
+def test_style_supplier_table_highlights_missing_emails():
+    from core.styling import style_supplier_table
+
+    df = pd.DataFrame(
+        {
+            "supplier_name": ["a", "b", "c", "d", "e"],
+            "supplier_email": ["a@x.com", np.nan, None, "  ", "None"],
+        }
+    )
+    styler = style_supplier_table(df)
+    styler._compute()
+    highlighted = sorted({r for (r, _c), props in styler.ctx.items() if props})
+    assert highlighted == [1, 2, 3, 4]
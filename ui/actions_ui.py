@@ -1,7 +1,10 @@
 # ui/actions_ui.py
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+from ui.app_helpers import df_to_csv_bytes
+
 
 def _apply_search(df: pd.DataFrame, q: str) -> pd.DataFrame:
     if df is None or df.empty:
@@ -10,9 +13,19 @@ def _apply_search(df: pd.DataFrame, q: str) -> pd.DataFrame:
     if not q:
         return df
 
-    # Search across all columns (stringified)
-    blob = df.astype(str).fillna("").agg(" ".join, axis=1).str.lower()
-    return df[blob.str.contains(q, na=False)].copy()
+    # OR per-column literal matches instead of building a row-wise blob.
+    # Text columns go first; stop as soon as every row already matches.
+    is_text = {c: pd.api.types.is_string_dtype(df[c]) for c in df.columns}
+    ordered = [c for c in df.columns if is_text[c]] + [c for c in df.columns if not is_text[c]]
+
+    mask = np.zeros(len(df), dtype=bool)
+    for c in ordered:
+        col = df[c] if is_text[c] else df[c].astype(str)
+        # q is a literal user string, not a pattern
+        mask |= col.str.lower().str.contains(q, regex=False, na=False).to_numpy(dtype=bool)
+        if mask.all():
+            break
+    return df[mask]
 
 
 def render_daily_action_list(actions: dict):
@@ -51,7 +64,7 @@ def render_daily_action_list(actions: dict):
             st.dataframe(cust_v, use_container_width=True, height=320)
             st.download_button(
                 "Download customer actions CSV",
-                data=cust_v.to_csv(index=False).encode("utf-8"),
+                data=df_to_csv_bytes(cust_v),
                 file_name="daily_customer_actions.csv",
                 mime="text/csv",
                 key="dl_customer_actions",
@@ -64,7 +77,7 @@ def render_daily_action_list(actions: dict):
             st.dataframe(supp_v, use_container_width=True, height=320)
             st.download_button(
                 "Download supplier actions CSV",
-                data=supp_v.to_csv(index=False).encode("utf-8"),
+                data=df_to_csv_bytes(supp_v),
                 file_name="daily_supplier_actions.csv",
                 mime="text/csv",
                 key="dl_supplier_actions",
@@ -77,56 +90,8 @@ def render_daily_action_list(actions: dict):
             st.dataframe(watch_v, use_container_width=True, height=320)
             st.download_button(
                 "Download watchlist CSV",
-                data=watch_v.to_csv(index=False).encode("utf-8"),
+                data=df_to_csv_bytes(watch_v),
                 file_name="daily_watchlist.csv",
                 mime="text/csv",
                 key="dl_watchlist",
             )
-# ui/actions_ui.py
-import pandas as pd
-import streamlit as st
-
-
-def render_daily_action_list(actions: dict):
-    st.divider()
-    st.subheader("Daily Action List (What to do today)")
-
-    summary = actions.get("summary", {}) or {}
-    c1, c2, c3 = st.columns(3)
-    c1.metric("Customer actions", summary.get("customer_actions", 0))
-    c2.metric("Supplier actions", summary.get("supplier_actions", 0))
-    c3.metric("Watchlist", summary.get("watchlist", 0))
-
-    cust = actions.get("customer_actions", pd.DataFrame())
-    supp = actions.get("supplier_actions", pd.DataFrame())
-    watch = actions.get("watchlist", pd.DataFrame())
-
-    with st.expander("🔴 Customer actions (protect customer experience)", expanded=True):
-        if cust is None or cust.empty:
-            st.caption("Nothing urgent found for customer-facing action.")
-        else:
-            st.dataframe(cust, use_container_width=True, height=260)
-            st.download_button(
-                "Download customer actions CSV",
-                data=cust.to_csv(index=False).encode("utf-8"),
-                file_name="daily_customer_actions.csv",
-                mime="text/csv",
-            )
-
-    with st.expander("🟠 Supplier actions (send follow-ups)", expanded=True):
-        if supp is None or supp.empty:
-            st.caption("No supplier follow-ups needed.")
-        else:
-            st.dataframe(supp, use_container_width=True, height=240)
-            st.download_button(
-                "Download supplier actions CSV",
-                data=supp.to_csv(index=False).encode("utf-8"),
-                file_name="daily_supplier_actions.csv",
-                mime="text/csv",
-            )
-
-    with st.expander("🟡 Watchlist (keep an eye on these)", expanded=False):
-        if watch is None or watch.empty:
-            st.caption("No watchlist items.")
-        else:
-            st.dataframe(watch, use_container_width=True, height=220)
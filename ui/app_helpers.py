@@ -2,25 +2,242 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import inspect
-from typing import Any, Callable
+import os
+from typing import Any, Callable, Optional
+from urllib.parse import quote
 
+import numpy as np
 import pandas as pd
+import streamlit as st
+
+try:
+    import pyarrow  # noqa: F401
+
+    _HAS_PYARROW = True
+except Exception:
+    _HAS_PYARROW = False
+
+# Optional: faster digests for cache keys (hashlib fallback)
+try:
+    import xxhash  # type: ignore
+except Exception:
+    xxhash = None
+
+# Uploads at least this large are parsed in bounded chunks instead of one shot.
+CHUNKED_READ_MIN_BYTES = 64 * 1024 * 1024
+CHUNKED_READ_ROWS = 250_000
+
+# Optional cap on rows read per uploaded CSV (0/unset = no cap). Chunked reads stop
+# parsing as soon as the cap is reached instead of materializing the whole file.
+try:
+    MAX_UPLOAD_ROWS: Optional[int] = int(os.getenv("DSH_MAX_UPLOAD_ROWS", "0") or 0) or None
+except ValueError:
+    MAX_UPLOAD_ROWS = None
+
+
+@functools.lru_cache(maxsize=256)
+def accepted_params(fn: Callable[..., Any]) -> frozenset:
+    """Parameter names of fn, introspected once per function."""
+    return frozenset(inspect.signature(fn).parameters)
 
 
 def call_with_accepted_kwargs(fn: Callable[..., Any], **kwargs):
     """Call fn with only the kwargs it accepts."""
-    sig = inspect.signature(fn)
-    accepted = {k: v for k, v in kwargs.items() if k in sig.parameters}
-    return fn(**accepted)
+    # Bound methods are new objects per instance: key the cache on the underlying function
+    # so it isn't filled with one entry per instance (self is never a kwarg anyway).
+    params = accepted_params(getattr(fn, "__func__", fn))
+    return fn(**{k: v for k, v in kwargs.items() if k in params})
+
+
+def _hash_buffer(values) -> memoryview:
+    """
+    Bytes to hash for one column/index. Plain numeric/bool/datetime NumPy columns are
+    hashed straight from their buffer; anything else (object, string, category,
+    nullable extension types) goes through pandas' vectorized per-value hashing.
+    """
+    arr = values.to_numpy() if isinstance(values.dtype, np.dtype) else None
+    if arr is not None and arr.dtype.kind in "biufcmM":
+        return memoryview(np.ascontiguousarray(arr).view(np.uint8))
+    return memoryview(pd.util.hash_pandas_object(values, index=False).to_numpy())
+
+
+def hash_df(df: pd.DataFrame) -> bytes:
+    """
+    Full-content cache key for st.cache_data(hash_funcs={pd.DataFrame: hash_df}).
+
+    Streamlit's default hasher samples rows on large frames, so an edit outside the
+    sample can return a stale pipeline result. This streams every column (plus the
+    index and the column/dtype schema) into one xxh3 digest, blake2b without xxhash.
+    """
+    h = xxhash.xxh3_128() if xxhash is not None else hashlib.blake2b(digest_size=16)
+    h.update(repr((df.shape, list(zip(map(str, df.columns), map(str, df.dtypes))))).encode("utf-8"))
+    h.update(_hash_buffer(df.index))
+    for _, col in df.items():
+        h.update(_hash_buffer(col))
+    return h.digest()
+
+
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: hash_df})
+def df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """
+    CSV bytes for st.download_button. data= is evaluated on every rerun, so the
+    encode only happens when the frame's content changes.
+    """
+    return df.to_csv(index=False).encode("utf-8")
 
 
 def mailto_fallback(to: str, subject: str, body: str) -> str:
     """Safe mailto generator used when core.email_utils.mailto_link is unavailable."""
-    from urllib.parse import quote
-
     return f"mailto:{quote(to or '')}?subject={quote(subject or '')}&body={quote(body or '')}"
 
 
 def is_empty_df(x) -> bool:
     return (x is None) or (not isinstance(x, pd.DataFrame)) or x.empty
+
+
+# Shared empty frame for read-only call sites (never mutate it).
+_EMPTY_DF = pd.DataFrame()
+
+
+def df_or_empty(x) -> pd.DataFrame:
+    """x if it is a DataFrame, else the shared read-only empty frame."""
+    return x if isinstance(x, pd.DataFrame) else _EMPTY_DF
+
+
+def df_or_new(x) -> pd.DataFrame:
+    """x if it is a DataFrame, else a fresh empty frame (for callees that may mutate it)."""
+    return x if isinstance(x, pd.DataFrame) else pd.DataFrame()
+
+
+def read_csv_typed(f, dtype: Optional[dict] = None) -> pd.DataFrame:
+    """
+    Read a CSV (path or uploaded file) with explicit column dtypes.
+    Keys absent from the file are ignored.
+
+    Uses the multithreaded pyarrow parser when available. pyarrow is stricter than
+    the C parser (ragged rows, odd quoting), so any failure retries with the C engine.
+    The fallback infers each column once over the whole file (low_memory=False) instead
+    of per internal block, which avoids mixed-type object columns on large exports.
+    """
+    if _HAS_PYARROW:
+        try:
+            return _read_csv_pyarrow(f, dtype)
+        except Exception:
+            if hasattr(f, "seek"):
+                f.seek(0)
+    return pd.read_csv(f, dtype=dtype, engine="c", low_memory=False)
+
+
+def _read_csv_pyarrow(f, dtype: Optional[dict] = None) -> pd.DataFrame:
+    """
+    pyarrow read where str columns are typed *while parsing*. pd.read_csv(engine="pyarrow")
+    only casts after pyarrow has inferred a type, so ids lose leading zeros ("00123" -> "123")
+    and long tracking numbers go through float ("9.400111899223817e+21").
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    dtype = dtype or {}
+    text_cols = {str(c): pa.string() for c, t in dtype.items() if t is str or t in ("str", "string", "object")}
+    table = pacsv.read_csv(
+        f,
+        convert_options=pacsv.ConvertOptions(column_types=text_cols, strings_can_be_null=True),
+    )
+    df = table.to_pandas()
+    rest = {c: t for c, t in dtype.items() if str(c) not in text_cols and c in df.columns}
+    return df.astype(rest) if rest else df
+
+
+def read_csv_chunked(
+    f,
+    dtype: Optional[dict] = None,
+    *,
+    chunksize: int = CHUNKED_READ_ROWS,
+    row_filter: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+    max_rows: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Read a large CSV in chunks (C engine) so peak memory stays bounded.
+    row_filter is applied per chunk before concat (e.g. drop rows without an order id).
+    With max_rows, parsing stops once that many (kept) rows have been read.
+    """
+    parts = []
+    n = 0
+    with pd.read_csv(f, dtype=dtype, chunksize=int(chunksize)) as reader:
+        for chunk in reader:
+            if callable(row_filter):
+                chunk = row_filter(chunk)
+            parts.append(chunk)
+            n += len(chunk)
+            if max_rows and n >= max_rows:
+                break
+    if not parts:
+        return pd.DataFrame()
+    df = pd.concat(parts, ignore_index=True)
+    return df.head(int(max_rows)) if max_rows and n > max_rows else df
+
+
+def _read_csv_upload_uncached(
+    f,
+    dtype: Optional[dict] = None,
+    *,
+    row_filter: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+    max_rows: Optional[int] = None,
+) -> pd.DataFrame:
+    size = getattr(f, "size", None)
+    if isinstance(size, int) and size >= CHUNKED_READ_MIN_BYTES:
+        return read_csv_chunked(f, dtype, row_filter=row_filter, max_rows=max_rows)
+
+    df = read_csv_typed(f, dtype)
+    if callable(row_filter):
+        df = row_filter(df)
+    return df.head(int(max_rows)) if max_rows and len(df) > max_rows else df
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _read_csv_upload_cached(
+    upload_key: tuple, dtype_sig: tuple, max_rows: Optional[int], _f, _dtype: Optional[dict]
+) -> pd.DataFrame:
+    # upload_key / dtype_sig / max_rows are the cache key; the file object + dtype map are just carried along
+    if hasattr(_f, "seek"):
+        _f.seek(0)
+    return _read_csv_upload_uncached(_f, _dtype, max_rows=max_rows)
+
+
+def read_csv_upload(
+    f,
+    dtype: Optional[dict] = None,
+    *,
+    row_filter: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+    max_rows: Optional[int] = MAX_UPLOAD_ROWS,
+) -> pd.DataFrame:
+    """
+    Read an uploaded CSV: one-shot typed read for normal files, chunked for very large ones.
+
+    The uploader hands back the same file on every rerun, so plain reads are cached per
+    upload (file_id + size when available, else the file bytes) instead of re-parsed.
+    max_rows (default DSH_MAX_UPLOAD_ROWS) truncates the upload with a warning.
+    """
+    # Read one row past the cap so a file with exactly max_rows rows isn't reported as truncated
+    limit = int(max_rows) + 1 if max_rows else None
+    df = None
+    if row_filter is None and hasattr(f, "getvalue"):
+        try:
+            file_id = getattr(f, "file_id", None)
+            upload_key = ("id", file_id, getattr(f, "size", None)) if file_id else ("bytes", f.getvalue())
+            dtype_sig = tuple(sorted((str(k), getattr(v, "__name__", str(v))) for k, v in (dtype or {}).items()))
+            df = _read_csv_upload_cached(upload_key, dtype_sig, limit, f, dtype)
+        except Exception:
+            if hasattr(f, "seek"):
+                f.seek(0)
+
+    if df is None:
+        df = _read_csv_upload_uncached(f, dtype, row_filter=row_filter, max_rows=limit)
+
+    if max_rows and len(df) > max_rows:
+        df = df.head(int(max_rows))
+        st.warning(f"{getattr(f, 'name', 'Upload')}: only the first {int(max_rows):,} rows were loaded.")
+    return df
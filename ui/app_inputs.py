@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Callable, Optional, Tuple
 
 import pandas as pd
 import streamlit as st
 
+from core.demo_schema import ORDERS_DTYPES, SHIPMENTS_DTYPES, TRACKING_DTYPES
+from ui.app_helpers import read_csv_upload
+
 
 def render_start_here(
     *,
@@ -56,15 +60,11 @@ def render_upload_section_fallback():
             key="uploader_tracking",
         )
 
-    uploads = type(
-        "U",
-        (),
-        {
-            "f_orders": f_orders,
-            "f_shipments": f_shipments,
-            "f_tracking": f_tracking,
-            "has_uploads": (f_orders is not None and f_shipments is not None),
-        },
+    uploads = SimpleNamespace(
+        f_orders=f_orders,
+        f_shipments=f_shipments,
+        f_tracking=f_tracking,
+        has_uploads=(f_orders is not None and f_shipments is not None),
     )
     return uploads
 
@@ -118,7 +118,7 @@ def resolve_raw_inputs(
         raw_tracking = st.session_state.get("demo_raw_tracking", pd.DataFrame())
         return raw_orders, raw_shipments, raw_tracking
 
-    raw_orders = pd.read_csv(uploads.f_orders)
-    raw_shipments = pd.read_csv(uploads.f_shipments)
-    raw_tracking = pd.read_csv(uploads.f_tracking) if uploads.f_tracking else pd.DataFrame()
+    raw_orders = read_csv_upload(uploads.f_orders, dtype=ORDERS_DTYPES)
+    raw_shipments = read_csv_upload(uploads.f_shipments, dtype=SHIPMENTS_DTYPES)
+    raw_tracking = read_csv_upload(uploads.f_tracking, dtype=TRACKING_DTYPES) if uploads.f_tracking else pd.DataFrame()
     return raw_orders, raw_shipments, raw_tracking
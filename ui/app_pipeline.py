@@ -9,14 +9,140 @@ original app.py.
 
 from __future__ import annotations
 
-from datetime import datetime
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from itertools import chain
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional, Tuple
 
 import pandas as pd
 import streamlit as st
 
-from ui.app_helpers import is_empty_df
+from ui.app_helpers import df_or_empty, df_or_new, hash_df, is_empty_df
+
+
+# -----------------------
+# Worker threads
+# -----------------------
+def _script_ctx():
+    """Current Streamlit script context (None outside a script run / on API changes)."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+        return get_script_run_ctx()
+    except Exception:
+        return None
+
+
+def _attach_script_ctx(ctx) -> None:
+    """ThreadPoolExecutor initializer: lets st.* / st.cache_data in workers see the session."""
+    if ctx is None:
+        return
+    try:
+        from streamlit.runtime.scriptrunner import add_script_run_ctx
+
+        add_script_run_ctx(threading.current_thread(), ctx)
+    except Exception:
+        pass
+
+
+# -----------------------
+# Cached pipeline steps
+# -----------------------
+# normalize_* and reconcile_all are pure: same raw frames + settings -> same output.
+# Streamlit reruns the script on every widget interaction, so serve repeats from
+# st.cache_data. The step callable is passed as `_fn` (leading underscore = not
+# hashed); the shell always wires exactly one implementation per step.
+# In memory only: entries hold tenant order/shipment data and the key leaves out the step code,
+# so nothing may outlive the process (a deploy restarts it) and the TTL bounds the rest,
+# including reconcile's aging of lines against "now".
+_PIPELINE_CACHE = dict(show_spinner=False, max_entries=8, ttl=3600, hash_funcs={pd.DataFrame: hash_df})
+
+
+@st.cache_data(**_PIPELINE_CACHE)
+def _cached_normalize_orders(
+    _fn: Callable[..., Any],
+    raw_orders: pd.DataFrame,
+    account_id: str,
+    store_id: str,
+    platform_hint: str,
+    default_currency: str,
+    default_promised_ship_days: int,
+):
+    return _fn(
+        raw_orders,
+        account_id=account_id,
+        store_id=store_id,
+        platform_hint=platform_hint,
+        default_currency=default_currency,
+        default_promised_ship_days=int(default_promised_ship_days),
+    )
+
+
+@st.cache_data(**_PIPELINE_CACHE)
+def _cached_normalize_shipments(_fn: Callable[..., Any], raw_shipments: pd.DataFrame, account_id: str, store_id: str):
+    return _fn(raw_shipments, account_id=account_id, store_id=store_id)
+
+
+@st.cache_data(**_PIPELINE_CACHE)
+def _cached_normalize_tracking(_fn: Callable[..., Any], raw_tracking: pd.DataFrame, account_id: str, store_id: str):
+    return _fn(raw_tracking, account_id=account_id, store_id=store_id)
+
+
+@st.cache_data(**_PIPELINE_CACHE)
+def _cached_reconcile_all(
+    _fn: Callable[..., Any],
+    orders: pd.DataFrame,
+    shipments: pd.DataFrame,
+    tracking: pd.DataFrame,
+):
+    return _fn(orders, shipments, tracking)
+
+
+@st.cache_data(**_PIPELINE_CACHE)
+def _cached_step(step: str, _fn: Callable[..., Any], *args, **kwargs):
+    """
+    Post-reconcile builders (explanations, supplier enrichment, urgency, scorecard,
+    customer impact) are pure too. `step` names the builder in the cache key, since
+    the callable itself is not hashed. Issue-tracker application stays uncached (disk state).
+    """
+    return _fn(*args, **kwargs)
+
+
+@st.cache_data(**_PIPELINE_CACHE)
+def _cached_ops_pack_bytes(
+    _fn: Callable[..., Any],
+    exceptions: pd.DataFrame,
+    followups: pd.DataFrame,
+    order_rollup: pd.DataFrame,
+    line_status_df: pd.DataFrame,
+    kpis: dict,
+    supplier_scorecards: pd.DataFrame,
+) -> bytes:
+    # Reruns on unchanged frames skip CSV + deflate work. In memory only (see _PIPELINE_CACHE):
+    # the ZIP is tenant data and the key doesn't change when the pack code does.
+    return _fn(
+        exceptions=exceptions,
+        followups=followups,
+        order_rollup=order_rollup,
+        line_status_df=line_status_df,
+        kpis=kpis,
+        supplier_scorecards=supplier_scorecards,
+    )
+
+
+def _same_frame(a: pd.DataFrame, b: pd.DataFrame) -> bool:
+    """Identity, else equal shape + full-content hash (hash_df)."""
+    if a is b:
+        return True
+    if a.shape != b.shape:
+        return False
+    try:
+        return hash_df(a) == hash_df(b)
+    except Exception:
+        return False
 
 
 def run_pipeline(
@@ -92,28 +218,45 @@ def run_pipeline(
     st.divider()
     st.subheader("Data checks")
 
-    orders, meta_o = normalize_orders(
-        raw_orders,
-        account_id=account_id,
-        store_id=store_id,
-        platform_hint=platform_hint,
-        default_currency=default_currency,
-        default_promised_ship_days=int(default_promised_ship_days),
-    )
-    shipments, meta_s = normalize_shipments(raw_shipments, account_id=account_id, store_id=store_id)
-
-    tracking = pd.DataFrame()
-    meta_t = {"validation_errors": []}
-    if raw_tracking is not None and isinstance(raw_tracking, pd.DataFrame) and not raw_tracking.empty:
-        tracking, meta_t = normalize_tracking(raw_tracking, account_id=account_id, store_id=store_id)
+    # The three normalizers are independent; run them side by side (pandas releases the GIL
+    # in most C-level work). On a warm cache each future is just a cache lookup.
+    has_tracking = raw_tracking is not None and isinstance(raw_tracking, pd.DataFrame) and not raw_tracking.empty
+    with ThreadPoolExecutor(max_workers=3, initializer=_attach_script_ctx, initargs=(_script_ctx(),)) as ex:
+        f_orders = ex.submit(
+            _cached_normalize_orders,
+            normalize_orders,
+            raw_orders,
+            account_id,
+            store_id,
+            platform_hint,
+            default_currency,
+            int(default_promised_ship_days),
+        )
+        f_shipments = ex.submit(_cached_normalize_shipments, normalize_shipments, raw_shipments, account_id, store_id)
+        f_tracking = (
+            ex.submit(_cached_normalize_tracking, normalize_tracking, raw_tracking, account_id, store_id)
+            if has_tracking
+            else None
+        )
 
-    errs = meta_o.get("validation_errors", []) + meta_s.get("validation_errors", []) + meta_t.get(
-        "validation_errors", []
+        orders, meta_o = f_orders.result()
+        shipments, meta_s = f_shipments.result()
+        if f_tracking is not None:
+            tracking, meta_t = f_tracking.result()
+        else:
+            tracking, meta_t = pd.DataFrame(), {"validation_errors": []}
+
+    errs = list(
+        chain(
+            meta_o.get("validation_errors", ()),
+            meta_s.get("validation_errors", ()),
+            meta_t.get("validation_errors", ()),
+        )
     )
     if errs:
         st.warning("We found some schema issues. You can still proceed, but fixing these improves accuracy:")
-        for e in errs:
-            st.write("- ", e)
+        # One markdown element instead of one st.write per issue
+        st.markdown("\n".join(f"- {e}" for e in errs))
     else:
         st.success("Looks good ✅")
 
@@ -124,7 +267,9 @@ def run_pipeline(
     st.subheader("Running reconciliation")
 
     try:
-        line_status_df, exceptions, followups, order_rollup, kpis = reconcile_all(orders, shipments, tracking)
+        line_status_df, exceptions, followups, order_rollup, kpis = _cached_reconcile_all(
+            reconcile_all, orders, shipments, tracking
+        )
     except Exception as e:
         st.error("Reconciliation failed. Showing debug details below.")
         st.markdown("### Debug: normalized inputs")
@@ -142,29 +287,42 @@ def run_pipeline(
                 st.dataframe(tracking.head(5), use_container_width=True)
         st.stop()
 
-    # Explain enhancements (best-effort)
-    try:
-        exceptions = enhance_explanations(exceptions)
-    except Exception:
-        pass
+    # Explain enhancements (best-effort; nothing to explain on an empty queue)
+    if not is_empty_df(exceptions):
+        try:
+            exceptions = _cached_step("enhance_explanations", enhance_explanations, exceptions)
+        except Exception:
+            pass
 
-    # Enrich followups + add missing supplier contact exceptions
-    followups = enrich_followups_with_suppliers(followups, suppliers_df)
-    exceptions = add_missing_supplier_contact_exceptions(exceptions, followups)
+    # Enrich followups + add missing supplier contact exceptions.
+    # Both are no-ops without followups (and enrichment without a directory), so skip the
+    # call + cache-key hashing in those cases.
+    if not is_empty_df(followups):
+        if not is_empty_df(suppliers_df):
+            followups = _cached_step(
+                "enrich_followups_with_suppliers", enrich_followups_with_suppliers, followups, suppliers_df
+            )
+        exceptions = _cached_step(
+            "add_missing_supplier_contact_exceptions", add_missing_supplier_contact_exceptions, exceptions, followups
+        )
 
     # Ensure urgency exists
     if exceptions is not None and not exceptions.empty and "Urgency" not in exceptions.columns:
-        exceptions = add_urgency_column(exceptions)
+        exceptions = _cached_step("add_urgency_column", add_urgency_column, exceptions)
 
-    # Scorecard
-    scorecard = build_supplier_scorecard_from_run(line_status_df, exceptions)
+    # Scorecard (cached on the final line status + exceptions)
+    scorecard = _cached_step(
+        "build_supplier_scorecard_from_run", build_supplier_scorecard_from_run, line_status_df, exceptions
+    )
 
     # -----------------------
     # SLA escalations (optional UI)
     # -----------------------
-    followups_full = followups.copy() if isinstance(followups, pd.DataFrame) else pd.DataFrame()
-    followups_open = followups_full.copy()
-    followups_open_enriched = followups_open.copy()
+    # No defensive copies: every downstream step (SLA UI, issue tracker, views) copies before it writes,
+    # so these names can share one frame until something actually diverges.
+    followups_full = followups if isinstance(followups, pd.DataFrame) else pd.DataFrame()
+    followups_open = followups_full
+    followups_open_enriched = followups_open
     escalations_df = pd.DataFrame()
 
     if callable(render_sla_escalations):
@@ -175,15 +333,20 @@ def run_pipeline(
                 promised_ship_days=int(default_promised_ship_days),
             )
             if isinstance(followups_full_from_ui, pd.DataFrame) and not followups_full_from_ui.empty:
-                followups_full = followups_full_from_ui.copy()
+                followups_full = followups_full_from_ui
         except Exception:
             pass
 
     # -----------------------
     # Workspace root + issue tracker
     # -----------------------
-    ws_root = workspace_root(workspaces_dir, account_id, store_id)
-    ws_root.mkdir(parents=True, exist_ok=True)
+    # Resolve + create once per tenant per session; later reruns skip the mkdir/stat
+    ws_root_key = f"_ws_root::{workspaces_dir}::{account_id}::{store_id}"
+    ws_root = st.session_state.get(ws_root_key)
+    if ws_root is None:
+        ws_root = workspace_root(workspaces_dir, account_id, store_id)
+        ws_root.mkdir(parents=True, exist_ok=True)
+        st.session_state[ws_root_key] = ws_root
     issue_tracker_path = Path(ws_root) / "issue_tracker.json"
 
     with st.sidebar:
@@ -197,30 +360,41 @@ def run_pipeline(
             followups_open = it["followups_open"]
             followups_open_enriched = it.get("followups_open_enriched", followups_open)
         except Exception:
-            followups_open = followups_full.copy()
-            followups_open_enriched = followups_open.copy()
+            followups_open = followups_full
+            followups_open_enriched = followups_open
 
     # -----------------------
-    # Customer impact (optional)
+    # Customer impact (optional; nothing to assess on an empty queue)
     # -----------------------
     customer_impact = pd.DataFrame()
-    if callable(build_customer_impact_view):
+    if callable(build_customer_impact_view) and not is_empty_df(exceptions):
         try:
-            customer_impact = build_customer_impact_view(exceptions=exceptions, max_items=50)
+            customer_impact = _cached_step(
+                "build_customer_impact_view", build_customer_impact_view, exceptions=exceptions, max_items=50
+            )
         except Exception:
             customer_impact = pd.DataFrame()
 
     # -----------------------
     # Daily ops pack
     # -----------------------
-    pack_date = datetime.now().strftime("%Y%m%d")
+    # Formatted once per day per session; the ordinal in the key rotates it at midnight
+    today = date.today()
+    pack_date_key = f"_pack_date::{today.toordinal()}"
+    pack_date = st.session_state.get(pack_date_key)
+    if pack_date is None:
+        pack_date = st.session_state[pack_date_key] = today.strftime("%Y%m%d")
     pack_name = f"daily_ops_pack_{pack_date}.zip"
 
-    ops_pack_bytes = make_daily_ops_pack_bytes(
-        exceptions=exceptions if exceptions is not None else pd.DataFrame(),
-        followups=followups_open if followups_open is not None else pd.DataFrame(),
-        order_rollup=order_rollup if order_rollup is not None else pd.DataFrame(),
-        line_status_df=line_status_df if line_status_df is not None else pd.DataFrame(),
+    # Lazy: the triage panel calls this only once the user asks for the ZIP, so reruns
+    # don't pay for hashing five frames + CSV/deflate when nobody downloads.
+    ops_pack_bytes = functools.partial(
+        _cached_ops_pack_bytes,
+        make_daily_ops_pack_bytes,
+        exceptions=df_or_empty(exceptions),
+        followups=df_or_empty(followups_open),
+        order_rollup=df_or_empty(order_rollup),
+        line_status_df=df_or_empty(line_status_df),
         kpis=kpis if isinstance(kpis, dict) else {},
         supplier_scorecards=scorecard,
     )
@@ -229,6 +403,7 @@ def run_pipeline(
     # Workspaces UI override (optional)
     # -----------------------
     if callable(render_workspaces_sidebar_and_maybe_override_outputs):
+        # Fresh frames, not the shared sentinel: the workspaces UI hands these back as outputs
         exceptions, followups_ws, order_rollup, line_status_df, suppliers_df = render_workspaces_sidebar_and_maybe_override_outputs(
             workspaces_dir=workspaces_dir,
             account_id=account_id,
@@ -237,16 +412,19 @@ def run_pipeline(
             orders=orders,
             shipments=shipments,
             tracking=tracking,
-            exceptions=exceptions if exceptions is not None else pd.DataFrame(),
-            followups=followups_full if followups_full is not None else pd.DataFrame(),
-            order_rollup=order_rollup if order_rollup is not None else pd.DataFrame(),
-            line_status_df=line_status_df if line_status_df is not None else pd.DataFrame(),
+            exceptions=df_or_new(exceptions),
+            followups=df_or_new(followups_full),
+            order_rollup=df_or_new(order_rollup),
+            line_status_df=df_or_new(line_status_df),
             kpis=kpis if isinstance(kpis, dict) else {},
-            suppliers_df=suppliers_df if suppliers_df is not None else pd.DataFrame(),
+            suppliers_df=df_or_new(suppliers_df),
         )
 
-        if isinstance(followups_ws, pd.DataFrame):
-            followups_full = followups_ws.copy()
+        # Only re-derive open/enriched followups when a loaded run actually replaced them;
+        # a pass-through returns the same frame we already ran the issue tracker on, and a
+        # loaded run with identical followups (same content hash) changes nothing either.
+        if isinstance(followups_ws, pd.DataFrame) and not _same_frame(followups_ws, df_or_empty(followups_full)):
+            followups_full = followups_ws
             if callable(apply_issue_tracker):
                 try:
                     it = apply_issue_tracker(ws_root=ws_root, followups_full=followups_full)
@@ -254,11 +432,11 @@ def run_pipeline(
                     followups_open = it["followups_open"]
                     followups_open_enriched = it.get("followups_open_enriched", followups_open)
                 except Exception:
-                    followups_open = followups_full.copy()
-                    followups_open_enriched = followups_open.copy()
+                    followups_open = followups_full
+                    followups_open_enriched = followups_open
             else:
-                followups_open = followups_full.copy()
-                followups_open_enriched = followups_open.copy()
+                followups_open = followups_full
+                followups_open_enriched = followups_open
 
     return {
         "orders": orders,
@@ -5,30 +5,22 @@ Split out of app.py to keep files <500 lines while preserving behavior.
 
 from __future__ import annotations
 
-import inspect
+from itertools import chain
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Callable, Dict, Optional, Tuple
 
 import pandas as pd
 import streamlit as st
 
+from core.demo_schema import ORDERS_DTYPES, SHIPMENTS_DTYPES, TRACKING_DTYPES
+from ui.app_helpers import call_with_accepted_kwargs, mailto_fallback, read_csv_upload  # noqa: F401 (call_with_accepted_kwargs + mailto_fallback kept importable from here)
+
 
 # -----------------------------
 # Small shared helpers
 # -----------------------------
 
-def call_with_accepted_kwargs(fn: Callable[..., Any], **kwargs):
-    sig = inspect.signature(fn)
-    accepted = {k: v for k, v in kwargs.items() if k in sig.parameters}
-    return fn(**accepted)
-
-
-def mailto_fallback(to: str, subject: str, body: str) -> str:
-    from urllib.parse import quote
-
-    return f"mailto:{quote(to or '')}?subject={quote(subject or '')}&body={quote(body or '')}"
-
-
 def is_empty_df(x) -> bool:
     return (x is None) or (not isinstance(x, pd.DataFrame)) or x.empty
 
@@ -79,15 +71,11 @@ def render_upload_and_templates(
         with c3:
             f_tracking = st.file_uploader("Tracking CSV\n(optional)", type=["csv"], key="uploader_tracking")
 
-        uploads = type(
-            "U",
-            (),
-            {
-                "f_orders": f_orders,
-                "f_shipments": f_shipments,
-                "f_tracking": f_tracking,
-                "has_uploads": (f_orders is not None and f_shipments is not None),
-            },
+        uploads = SimpleNamespace(
+            f_orders=f_orders,
+            f_shipments=f_shipments,
+            f_tracking=f_tracking,
+            has_uploads=(f_orders is not None and f_shipments is not None),
         )
 
     if callable(render_template_downloads):
@@ -124,9 +112,9 @@ def resolve_raw_inputs(
         raw_tracking = st.session_state.get("demo_raw_tracking", pd.DataFrame())
         return raw_orders, raw_shipments, raw_tracking
 
-    raw_orders = pd.read_csv(uploads.f_orders)
-    raw_shipments = pd.read_csv(uploads.f_shipments)
-    raw_tracking = pd.read_csv(uploads.f_tracking) if uploads.f_tracking else pd.DataFrame()
+    raw_orders = read_csv_upload(uploads.f_orders, dtype=ORDERS_DTYPES)
+    raw_shipments = read_csv_upload(uploads.f_shipments, dtype=SHIPMENTS_DTYPES)
+    raw_tracking = read_csv_upload(uploads.f_tracking, dtype=TRACKING_DTYPES) if uploads.f_tracking else pd.DataFrame()
     return raw_orders, raw_shipments, raw_tracking
 
 
@@ -166,15 +154,17 @@ def normalize_inputs(
     if raw_tracking is not None and isinstance(raw_tracking, pd.DataFrame) and not raw_tracking.empty:
         tracking, meta_t = normalize_tracking(raw_tracking, account_id=account_id, store_id=store_id)
 
-    errs = (
-        meta_o.get("validation_errors", [])
-        + meta_s.get("validation_errors", [])
-        + meta_t.get("validation_errors", [])
+    errs = list(
+        chain(
+            meta_o.get("validation_errors", ()),
+            meta_s.get("validation_errors", ()),
+            meta_t.get("validation_errors", ()),
+        )
     )
     if errs:
         st.warning("We found some schema issues. You can still proceed, but fixing these improves accuracy:")
-        for e in errs:
-            st.write("- ", e)
+        # One markdown element instead of one st.write per issue
+        st.markdown("\n".join(f"- {e}" for e in errs))
     else:
         st.success("Looks good ✅")
 
@@ -2,20 +2,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
+import importlib
 from pathlib import Path
 from typing import Any, Optional, Callable
-import inspect
 import re
 
 import pandas as pd
 import streamlit as st
 
+from ui.app_helpers import _EMPTY_DF, accepted_params
+
 
 @dataclass
 class _ShellDeps:
     # sidebar + onboarding
     render_sidebar_context: Callable[..., dict]
-    render_onboarding_checklist: Optional[Callable[..., Any]]
 
     # inputs (sections)
     render_upload_and_templates: Callable[..., Any]
@@ -40,15 +42,6 @@ class _ShellDeps:
 
     workspace_root: Callable[..., Path]
 
-    # optional pipeline callables
-    render_sla_escalations: Optional[Callable[..., Any]]
-    apply_issue_tracker: Optional[Callable[..., Any]]
-    render_issue_tracker_maintenance: Optional[Callable[..., Any]]
-    IssueTrackerStore: Optional[Any]
-    build_customer_impact_view: Optional[Callable[..., Any]]
-    mailto_link: Optional[Callable[..., Any]]
-    render_workspaces_sidebar_and_maybe_override_outputs: Optional[Callable[..., Any]]
-
     # views
     render_dashboard: Callable[..., Any]
     render_ops_triage: Callable[..., Any]
@@ -56,15 +49,16 @@ class _ShellDeps:
     render_supplier_scorecards: Callable[..., Any]
     render_ops_outreach_comms: Callable[..., Any]
 
-    # optional tab UIs
-    render_sla_escalations_panel: Optional[Callable[..., Any]]
-    render_issue_tracker_ui: Optional[Callable[..., Any]]
-    render_kpi_trends: Optional[Callable[..., Any]]
-    render_workspaces_sidebar: Optional[Callable[..., Any]]
-
     # paths init
     init_paths: Callable[..., tuple[Path, Path, Path, Path]]
 
+    # Optional deps (the _OPTIONAL table) are not fields: they resolve on first attribute
+    # access, so a module is only imported once something actually uses it (None if unavailable).
+    def __getattr__(self, name: str) -> Any:
+        if name in _OPTIONAL:
+            return _opt(name)
+        raise AttributeError(name)
+
 
 _UNEXPECTED_KW_RE = re.compile(r"unexpected keyword argument '([^']+)'")
 
@@ -82,8 +76,8 @@ def _call_with_accepted_kwargs(fn: Callable[..., Any], **kwargs):
     """
     filtered = dict(kwargs)
     try:
-        sig = inspect.signature(fn)
-        filtered = {k: v for k, v in kwargs.items() if k in sig.parameters}
+        params = accepted_params(fn)
+        filtered = {k: v for k, v in kwargs.items() if k in params}
         return fn(**filtered)
     except TypeError as e:
         msg = str(e)
@@ -134,13 +128,46 @@ def _require_import(name: str, import_attempts: list[Callable[[], Any]]) -> Any:
     st.stop()
 
 
+# Optional deps: name -> (module, attribute). Resolved on first use by _opt.
+_OPTIONAL: dict[str, tuple[str, str]] = {
+    "render_onboarding_checklist": ("ui.onboarding_ui", "render_onboarding_checklist"),
+    "render_sla_escalations_panel": ("ui.app_views", "render_sla_escalations_panel"),
+    "render_issue_tracker_ui": ("ui.issue_tracker_ui", "render_issue_tracker"),
+    "render_kpi_trends": ("ui.kpi_trends_ui", "render_kpi_trends"),
+    "render_workspaces_sidebar": ("ui.workspaces_ui", "render_workspaces_sidebar"),
+    "render_sla_escalations": ("ui.sla_escalations_ui", "render_sla_escalations"),
+    "IssueTrackerStore": ("core.issue_tracker", "IssueTrackerStore"),
+    "build_customer_impact_view": ("core.customer_impact", "build_customer_impact_view"),
+    "apply_issue_tracker": ("core.issue_tracker_apply", "apply_issue_tracker"),
+    "render_issue_tracker_maintenance": ("ui.issue_tracker_maintenance_ui", "render_issue_tracker_maintenance"),
+    "mailto_link": ("ui.app_sections", "mailto_fallback"),
+    "render_workspaces_sidebar_and_maybe_override_outputs": (
+        "ui.workspaces_ui",
+        "render_workspaces_sidebar_and_maybe_override_outputs",
+    ),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _opt(name: str) -> Any:
+    """
+    Optional dependency lookup, memoized per process (reruns skip the import machinery).
+    Returns None when the module/attribute is unavailable — optional features must never break the app.
+    """
+    try:
+        module, attr = _OPTIONAL[name]
+        return getattr(importlib.import_module(module), attr)
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
 def _safe_imports() -> _ShellDeps:
+    # Resolved once per process like _opt: later reruns reuse the same deps instead of walking
+    # every import fallback again. A failed lookup st.stop()s (raises), so it is never cached.
+
     # Sidebar + onboarding
     from ui.sidebar import render_sidebar_context
-    try:
-        from ui.onboarding_ui import render_onboarding_checklist
-    except Exception:
-        render_onboarding_checklist = None
 
     # Sections (uploads / raw input resolution)
     from ui import app_sections as sections
@@ -161,28 +188,6 @@ def _safe_imports() -> _ShellDeps:
         render_ops_outreach_comms,
     )
 
-    # Optional tab UIs
-    try:
-        from ui.app_views import render_sla_escalations_panel
-    except Exception:
-        render_sla_escalations_panel = None
-
-    try:
-        from ui.issue_tracker_ui import render_issue_tracker as render_issue_tracker_ui
-    except Exception:
-        render_issue_tracker_ui = None
-
-    try:
-        from ui.kpi_trends_ui import render_kpi_trends
-    except Exception:
-        render_kpi_trends = None
-
-    # Optional workspaces sidebar (UI)
-    try:
-        from ui.workspaces_ui import render_workspaces_sidebar
-    except Exception:
-        render_workspaces_sidebar = None
-
     # ---------- Required pipeline deps ----------
     normalize_orders = _require_import(
         "normalize_orders",
@@ -261,45 +266,8 @@ def _safe_imports() -> _ShellDeps:
         ],
     )
 
-    # ---------- Optional pipeline deps ----------
-    try:
-        from ui.sla_escalations_ui import render_sla_escalations  # type: ignore
-    except Exception:
-        render_sla_escalations = None
-
-    try:
-        from core.issue_tracker import IssueTrackerStore  # type: ignore
-    except Exception:
-        IssueTrackerStore = None
-
-    try:
-        from core.customer_impact import build_customer_impact_view  # type: ignore
-    except Exception:
-        build_customer_impact_view = None
-
-    try:
-        from core.issue_tracker_apply import apply_issue_tracker  # type: ignore
-    except Exception:
-        apply_issue_tracker = None
-
-    try:
-        from ui.issue_tracker_maintenance_ui import render_issue_tracker_maintenance  # type: ignore
-    except Exception:
-        render_issue_tracker_maintenance = None
-
-    try:
-        from ui.app_sections import mailto_fallback as mailto_link  # type: ignore
-    except Exception:
-        mailto_link = None
-
-    try:
-        from ui.workspaces_ui import render_workspaces_sidebar_and_maybe_override_outputs  # type: ignore
-    except Exception:
-        render_workspaces_sidebar_and_maybe_override_outputs = None
-
     return _ShellDeps(
         render_sidebar_context=render_sidebar_context,
-        render_onboarding_checklist=render_onboarding_checklist,
         render_upload_and_templates=sections.render_upload_and_templates,
         resolve_raw_inputs=sections.resolve_raw_inputs,
         stop_if_missing_required_inputs=sections.stop_if_missing_required_inputs,
@@ -315,22 +283,11 @@ def _safe_imports() -> _ShellDeps:
         build_supplier_scorecard_from_run=build_supplier_scorecard_from_run,
         make_daily_ops_pack_bytes=make_daily_ops_pack_bytes,
         workspace_root=workspace_root,
-        render_sla_escalations=render_sla_escalations,
-        apply_issue_tracker=apply_issue_tracker,
-        render_issue_tracker_maintenance=render_issue_tracker_maintenance,
-        IssueTrackerStore=IssueTrackerStore,
-        build_customer_impact_view=build_customer_impact_view,
-        mailto_link=mailto_link,
-        render_workspaces_sidebar_and_maybe_override_outputs=render_workspaces_sidebar_and_maybe_override_outputs,
         render_dashboard=render_dashboard,
         render_ops_triage=render_ops_triage,
         render_exceptions_queue_section=render_exceptions_queue_section,
         render_supplier_scorecards=render_supplier_scorecards,
         render_ops_outreach_comms=render_ops_outreach_comms,
-        render_sla_escalations_panel=render_sla_escalations_panel,
-        render_issue_tracker_ui=render_issue_tracker_ui,
-        render_kpi_trends=render_kpi_trends,
-        render_workspaces_sidebar=render_workspaces_sidebar,
         init_paths=init_paths,
     )
 
@@ -343,7 +300,12 @@ def render_app() -> None:
 
     # Paths
     base_dir = Path(__file__).resolve().parent.parent
-    _base_dir, data_dir, workspaces_dir, suppliers_dir = deps.init_paths(base_dir)
+    # init_paths validates + creates the storage dirs; once per session is enough
+    paths = st.session_state.get("_app_paths")
+    if paths is None:
+        paths = deps.init_paths(base_dir)
+        st.session_state["_app_paths"] = paths
+    _base_dir, data_dir, workspaces_dir, suppliers_dir = paths
 
     # Sidebar context (tenant/defaults/demo/suppliers)
     sb = deps.render_sidebar_context(
@@ -358,7 +320,7 @@ def render_app() -> None:
     platform_hint = str(sb.get("platform_hint", "other") or "other")
     default_currency = str(sb.get("default_currency", "USD") or "USD")
     promised_days = int(sb.get("default_promised_ship_days", 3) or 3)
-    suppliers_df = sb.get("suppliers_df", pd.DataFrame())
+    suppliers_df = sb.get("suppliers_df", _EMPTY_DF)
     demo_mode = bool(sb.get("demo_mode", False))
 
     # Optional: onboarding checklist
@@ -428,7 +390,7 @@ def render_app() -> None:
 
     # Backward-compat mapping
     if "supplier_scorecards" not in view and "scorecard" in view:
-        view["supplier_scorecards"] = view.get("scorecard", pd.DataFrame())
+        view["supplier_scorecards"] = view.get("scorecard", _EMPTY_DF)
 
     # ---------- Main tabs ----------
     tabs = st.tabs(
@@ -449,7 +411,7 @@ def render_app() -> None:
             _call_with_accepted_kwargs(
                 deps.render_dashboard,
                 kpis=view.get("kpis", {}),
-                run_history_df=view.get("run_history_df", pd.DataFrame()),
+                run_history_df=view.get("run_history_df", _EMPTY_DF),
                 view=view,
             )
         except Exception as e:
@@ -460,8 +422,10 @@ def render_app() -> None:
         try:
             _call_with_accepted_kwargs(
                 deps.render_ops_triage,
-                exceptions=view.get("exceptions", pd.DataFrame()),
-                followups_open=view.get("followups_open", pd.DataFrame()),
+                exceptions=view.get("exceptions", _EMPTY_DF),
+                followups_open=view.get("followups_open", _EMPTY_DF),
+                ops_pack_bytes=view.get("ops_pack_bytes"),
+                pack_name=view.get("pack_name", "daily_ops_pack.zip"),
                 view=view,
             )
         except Exception as e:
@@ -472,7 +436,7 @@ def render_app() -> None:
         try:
             _call_with_accepted_kwargs(
                 deps.render_exceptions_queue_section,
-                exceptions=view.get("exceptions", pd.DataFrame()),
+                exceptions=view.get("exceptions", _EMPTY_DF),
                 view=view,
             )
         except Exception as e:
@@ -483,8 +447,8 @@ def render_app() -> None:
         try:
             _call_with_accepted_kwargs(
                 deps.render_supplier_scorecards,
-                supplier_scorecards=view.get("supplier_scorecards", pd.DataFrame()),
-                scorecard=view.get("scorecard", pd.DataFrame()),
+                supplier_scorecards=view.get("supplier_scorecards", _EMPTY_DF),
+                scorecard=view.get("scorecard", _EMPTY_DF),
                 view=view,
             )
         except Exception as e:
@@ -495,8 +459,8 @@ def render_app() -> None:
         try:
             _call_with_accepted_kwargs(
                 deps.render_ops_outreach_comms,
-                followups_open=view.get("followups_open", pd.DataFrame()),
-                customer_impact=view.get("customer_impact", pd.DataFrame()),
+                followups_open=view.get("followups_open", _EMPTY_DF),
+                customer_impact=view.get("customer_impact", _EMPTY_DF),
                 mailto_link=view.get("mailto_link", ""),
                 view=view,
             )
@@ -509,11 +473,11 @@ def render_app() -> None:
             if callable(deps.render_sla_escalations_panel):
                 _call_with_accepted_kwargs(
                     deps.render_sla_escalations_panel,
-                    escalations_df=view.get("escalations_df", pd.DataFrame()),
+                    escalations_df=view.get("escalations_df", _EMPTY_DF),
                     view=view,
                 )
             else:
-                df = view.get("escalations_df", pd.DataFrame())
+                df = view.get("escalations_df", _EMPTY_DF)
                 if isinstance(df, pd.DataFrame) and not df.empty:
                     st.dataframe(df, use_container_width=True)
                 else:
@@ -5,10 +5,48 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Callable, Optional
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
-from ui.app_helpers import call_with_accepted_kwargs, mailto_fallback
+from ui.app_helpers import call_with_accepted_kwargs, df_to_csv_bytes, hash_df, is_empty_df, mailto_fallback
+
+# Large tables only ship this many rows to the browser unless the user asks for all of them.
+MAX_TABLE_ROWS = 500
+
+# st.fragment (Streamlit >= 1.37), st.experimental_fragment (1.33+), else a no-op
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda fn: fn)
+
+
+def _bounded_dataframe(df: pd.DataFrame, *, key: str, height: int, styler: Optional[Callable[..., Any]] = None) -> None:
+    """
+    st.dataframe capped at MAX_TABLE_ROWS (Arrow payload scales with rows), with an opt-in "show all".
+    The styler (per-cell Python) only runs on at most MAX_TABLE_ROWS rows; "show all" renders unstyled.
+    """
+    view = df
+    if len(df) > MAX_TABLE_ROWS:
+        show_all = st.checkbox(f"Show all {len(df):,} rows (unstyled)", value=False, key=f"{key}_show_all")
+        if not show_all:
+            view = df.head(MAX_TABLE_ROWS)
+            st.caption(f"Showing first {MAX_TABLE_ROWS:,} of {len(df):,} rows — download the CSV for the full set")
+
+    if callable(styler) and len(view) <= MAX_TABLE_ROWS:
+        try:
+            st.dataframe(styler(view), use_container_width=True, height=height)
+            return
+        except Exception:
+            pass
+    st.dataframe(view, use_container_width=True, height=height)
+
+
+# Dashboard KPI tiles: (label, kpis key, value formatter)
+_KPI_METRICS = (
+    ("Order lines", "total_order_lines", int),
+    ("% Shipped/Delivered", "pct_shipped_or_delivered", "{}%".format),
+    ("% Delivered", "pct_delivered", "{}%".format),
+    ("% Unshipped", "pct_unshipped", "{}%".format),
+    ("% Late Unshipped", "pct_late_unshipped", "{}%".format),
+)
 
 
 def render_dashboard(
@@ -26,20 +64,19 @@ def render_dashboard(
     st.divider()
     st.subheader("Dashboard")
 
-    k1, k2, k3, k4, k5 = st.columns(5)
-    k1.metric("Order lines", int((kpis or {}).get("total_order_lines", 0)))
-    k2.metric("% Shipped/Delivered", f"{(kpis or {}).get('pct_shipped_or_delivered', 0)}%")
-    k3.metric("% Delivered", f"{(kpis or {}).get('pct_delivered', 0)}%")
-    k4.metric("% Unshipped", f"{(kpis or {}).get('pct_unshipped', 0)}%")
-    k5.metric("% Late Unshipped", f"{(kpis or {}).get('pct_late_unshipped', 0)}%")
+    kpis_d = kpis if isinstance(kpis, dict) else {}
+    for col, (label, key, fmt) in zip(st.columns(len(_KPI_METRICS)), _KPI_METRICS):
+        col.metric(label, fmt(kpis_d.get(key, 0)))
 
     if callable(build_daily_action_list) and callable(render_daily_action_list):
-        try:
-            actions = build_daily_action_list(exceptions=exceptions, followups=followups_open, max_items=10)
-            render_daily_action_list(actions)
-        except Exception:
-            # Optional UI must never break the app
-            pass
+        # Nothing to act on: skip building three empty lists plus the search box and tabs
+        if not (is_empty_df(exceptions) and is_empty_df(followups_open)):
+            try:
+                actions = build_daily_action_list(exceptions=exceptions, followups=followups_open, max_items=10)
+                render_daily_action_list(actions)
+            except Exception:
+                # Optional UI must never break the app
+                pass
 
     if callable(render_kpi_trends):
         try:
@@ -49,11 +86,35 @@ def render_dashboard(
             pass
 
 
+def render_ops_pack_download(ops_pack_bytes: Any, pack_name: str, *, key_prefix: str = "triage") -> None:
+    """
+    Daily ops pack download. ops_pack_bytes may be the ZIP itself or a zero-arg builder;
+    a builder only runs after the user clicks "Prepare" (then stays prepared for the session).
+    """
+    if ops_pack_bytes is None:
+        return
+    if callable(ops_pack_bytes):
+        ready_key = f"{key_prefix}_ops_pack_ready"
+        if not st.session_state.get(ready_key):
+            if not st.button("📦 Prepare Daily Ops Pack ZIP", key=f"{key_prefix}_btn_prepare_ops_pack"):
+                return
+            st.session_state[ready_key] = True
+        ops_pack_bytes = ops_pack_bytes()
+
+    st.download_button(
+        "⬇️ Download Daily Ops Pack ZIP",
+        data=ops_pack_bytes,
+        file_name=pack_name,
+        mime="application/zip",
+        key=f"{key_prefix}_dl_ops_pack",
+    )
+
+
 def render_ops_triage(
     *,
     exceptions: pd.DataFrame,
-    ops_pack_bytes: bytes,
-    pack_name: str,
+    ops_pack_bytes: Any = None,
+    pack_name: str = "daily_ops_pack.zip",
     style_exceptions_table: Optional[Callable[..., Any]] = None,
     render_ops_triage_component: Optional[Callable[..., Any]] = None,
 ) -> None:
@@ -91,14 +152,17 @@ def render_ops_triage(
         return
 
     view = exceptions.head(10)
+    styled = False
     if callable(style_exceptions_table):
         try:
             st.dataframe(style_exceptions_table(view), use_container_width=True, height=320)
-            return
+            styled = True
         except Exception:
             pass
+    if not styled:
+        st.dataframe(view, use_container_width=True, height=320)
 
-    st.dataframe(view, use_container_width=True, height=320)
+    render_ops_pack_download(ops_pack_bytes, pack_name)
 
 
 def render_ops_outreach_comms(
@@ -122,57 +186,88 @@ def render_ops_outreach_comms(
     st.subheader("Ops Outreach (Comms)")
     tab1, tab2, tab3 = st.tabs(["Supplier Follow-ups", "Customer Emails", "Comms Pack"])
 
-    # Supplier Follow-ups
     with tab1:
-        if callable(render_supplier_followups_tab) and isinstance(followups_open, pd.DataFrame):
-            render_supplier_followups_tab(
-                followups_open=followups_open,
-                issue_tracker_path=issue_tracker_path,
-                contact_statuses=contact_statuses,
-                mailto_link_fn=mailto_link_fn if callable(mailto_link_fn) else mailto_fallback,
-                scorecard=scorecard if isinstance(scorecard, pd.DataFrame) else None,
-                build_supplier_accountability_view=build_supplier_accountability_view if callable(build_supplier_accountability_view) else None,
-                render_supplier_accountability=render_supplier_accountability if callable(render_supplier_accountability) else None,
-                key_prefix="supplier_followups",
-            )
-        else:
-            st.caption("Supplier follow-ups UI module not available.")
-            if followups_open is None or followups_open.empty:
-                st.info("No supplier follow-ups needed.")
-            else:
-                st.dataframe(followups_open, use_container_width=True, height=260)
+        _supplier_followups_tab(
+            followups_open=followups_open,
+            scorecard=scorecard,
+            issue_tracker_path=issue_tracker_path,
+            contact_statuses=contact_statuses,
+            mailto_link_fn=mailto_link_fn,
+            build_supplier_accountability_view=build_supplier_accountability_view,
+            render_supplier_accountability=render_supplier_accountability,
+            render_supplier_followups_tab=render_supplier_followups_tab,
+        )
 
-    # Customer emails
     with tab2:
-        st.caption("Customer-facing updates (email-first).")
-        if customer_impact is None or customer_impact.empty:
-            st.info("No customer-impact items detected for this run.")
-        else:
-            if callable(render_customer_comms_ui):
-                try:
-                    call_with_accepted_kwargs(
-                        render_customer_comms_ui,
-                        customer_impact=customer_impact,
-                        ws_root=ws_root,
-                        account_id=account_id,
-                        store_id=store_id,
-                    )
-                except Exception:
-                    try:
-                        render_customer_comms_ui(customer_impact=customer_impact)
-                    except Exception:
-                        render_customer_comms_ui(customer_impact)
-            else:
-                st.dataframe(customer_impact, use_container_width=True, height=320)
-
-    # Comms pack download
+        _customer_emails_tab(
+            customer_impact=customer_impact,
+            ws_root=ws_root,
+            account_id=account_id,
+            store_id=store_id,
+            render_customer_comms_ui=render_customer_comms_ui,
+        )
+
     with tab3:
-        st.caption("Download combined comms artifacts (supplier + customer).")
-        if callable(render_comms_pack_download):
+        _comms_pack_tab(
+            followups_open=followups_open,
+            customer_impact=customer_impact,
+            ws_root=ws_root,
+            account_id=account_id,
+            store_id=store_id,
+            render_comms_pack_download=render_comms_pack_download,
+        )
+
+
+# Each outreach tab is a fragment: a widget inside one tab reruns only that tab,
+# not the other two (customer comms UI, comms pack build) or the rest of the app.
+@_fragment
+def _supplier_followups_tab(
+    *,
+    followups_open: pd.DataFrame,
+    scorecard: pd.DataFrame,
+    issue_tracker_path: Path,
+    contact_statuses: list,
+    mailto_link_fn: Optional[Callable[[str, str, str], str]],
+    build_supplier_accountability_view: Optional[Callable[..., Any]],
+    render_supplier_accountability: Optional[Callable[..., Any]],
+    render_supplier_followups_tab: Optional[Callable[..., Any]],
+) -> None:
+    if callable(render_supplier_followups_tab) and isinstance(followups_open, pd.DataFrame):
+        render_supplier_followups_tab(
+            followups_open=followups_open,
+            issue_tracker_path=issue_tracker_path,
+            contact_statuses=contact_statuses,
+            mailto_link_fn=mailto_link_fn if callable(mailto_link_fn) else mailto_fallback,
+            scorecard=scorecard if isinstance(scorecard, pd.DataFrame) else None,
+            build_supplier_accountability_view=build_supplier_accountability_view if callable(build_supplier_accountability_view) else None,
+            render_supplier_accountability=render_supplier_accountability if callable(render_supplier_accountability) else None,
+            key_prefix="supplier_followups",
+        )
+    else:
+        st.caption("Supplier follow-ups UI module not available.")
+        if followups_open is None or followups_open.empty:
+            st.info("No supplier follow-ups needed.")
+        else:
+            _bounded_dataframe(followups_open, key="outreach_followups", height=260)
+
+
+@_fragment
+def _customer_emails_tab(
+    *,
+    customer_impact: pd.DataFrame,
+    ws_root: Path,
+    account_id: str,
+    store_id: str,
+    render_customer_comms_ui: Optional[Callable[..., Any]],
+) -> None:
+    st.caption("Customer-facing updates (email-first).")
+    if customer_impact is None or customer_impact.empty:
+        st.info("No customer-impact items detected for this run.")
+    else:
+        if callable(render_customer_comms_ui):
             try:
                 call_with_accepted_kwargs(
-                    render_comms_pack_download,
-                    followups=followups_open,
+                    render_customer_comms_ui,
                     customer_impact=customer_impact,
                     ws_root=ws_root,
                     account_id=account_id,
@@ -180,11 +275,106 @@ def render_ops_outreach_comms(
                 )
             except Exception:
                 try:
-                    render_comms_pack_download(followups=followups_open, customer_impact=customer_impact)
+                    render_customer_comms_ui(customer_impact=customer_impact)
                 except Exception:
-                    render_comms_pack_download()
+                    render_customer_comms_ui(customer_impact)
         else:
-            st.info("Comms pack UI module not available.")
+            _bounded_dataframe(customer_impact, key="outreach_customer_impact", height=320)
+
+
+@_fragment
+def _comms_pack_tab(
+    *,
+    followups_open: pd.DataFrame,
+    customer_impact: pd.DataFrame,
+    ws_root: Path,
+    account_id: str,
+    store_id: str,
+    render_comms_pack_download: Optional[Callable[..., Any]],
+) -> None:
+    st.caption("Download combined comms artifacts (supplier + customer).")
+    if callable(render_comms_pack_download):
+        try:
+            call_with_accepted_kwargs(
+                render_comms_pack_download,
+                followups=followups_open,
+                customer_impact=customer_impact,
+                ws_root=ws_root,
+                account_id=account_id,
+                store_id=store_id,
+            )
+        except Exception:
+            try:
+                render_comms_pack_download(followups=followups_open, customer_impact=customer_impact)
+            except Exception:
+                render_comms_pack_download()
+    else:
+        st.info("Comms pack UI module not available.")
+
+
+_URGENCY_OPTIONS = ["Critical", "High", "Medium", "Low"]
+_QUEUE_FILTER_COLS = ("issue_type", "customer_country", "supplier_name", "Urgency")
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _exceptions_queue_view(digest: bytes, _exceptions: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
+    """
+    (frame, options) for the queue, keyed on the exceptions digest the section computes once
+    per script run (the frame itself is not hashed again; fragment reruns reuse the digest).
+    Shared read-only across reruns (the queue never mutates it).
+    """
+    frame = _exceptions_queue_frame(_exceptions)
+    return frame, _exceptions_filter_options(frame)
+
+
+def _exceptions_queue_frame(exceptions: pd.DataFrame) -> pd.DataFrame:
+    """
+    The queue's view of exceptions, pre-sorted by (Urgency, order_id), with the low-cardinality
+    filter columns as category dtype: isin() compares integer codes and the unique values are
+    just .cat.categories. Filtering a sorted frame keeps its order, so the queue never re-sorts.
+    Categories of unordered astype("category") are sorted, so sort order matches the object column.
+    """
+    cols = {c: "category" for c in _QUEUE_FILTER_COLS if c in exceptions.columns and exceptions[c].dtype == object}
+    frame = exceptions.astype(cols) if cols else exceptions
+    sort_cols = [c for c in ("Urgency", "order_id") if c in frame.columns]
+    return frame.sort_values(sort_cols, ascending=True, kind="stable") if sort_cols else frame
+
+
+def _exceptions_filter_options(exceptions: pd.DataFrame) -> dict:
+    """
+    Sorted multiselect options per filter column (built once per exceptions frame, with the
+    queue frame). Blank country/supplier values are dropped.
+
+    "_covered" lists the columns whose every row value is one of the options, i.e. where
+    "all options selected" keeps every row and the isin() can be skipped.
+    """
+    out = {}
+    covered = set()
+    for col, drop_blank in (("issue_type", False), ("customer_country", True), ("supplier_name", True)):
+        if col not in exceptions.columns:
+            out[col] = []
+            continue
+        s = exceptions[col]
+        vals = s.cat.categories.tolist() if isinstance(s.dtype, pd.CategoricalDtype) else pd.unique(s.dropna())
+        if drop_blank:
+            kept = [v for v in vals if str(v).strip() != ""]
+            has_blank = len(kept) != len(vals)
+            vals = kept
+        else:
+            has_blank = False
+        out[col] = sorted(vals)
+        if not has_blank and not s.hasnans:
+            covered.add(col)
+    if "Urgency" in exceptions.columns and exceptions["Urgency"].isin(_URGENCY_OPTIONS).all():
+        covered.add("Urgency")
+    out["_covered"] = frozenset(covered)
+    return out
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _queue_csv_bytes(digest: bytes, selection: tuple, _filtered: pd.DataFrame) -> bytes:
+    """Download bytes for one filter selection of one exceptions frame (keyed without re-hashing rows)."""
+    return _filtered.to_csv(index=False).encode("utf-8")
 
 
 def render_exceptions_queue_section(
@@ -203,51 +393,52 @@ def render_exceptions_queue_section(
         st.info("No exceptions found 🎉")
         return
 
+    # The one full-content hash per script run; the fragment's reruns reuse it as their cache key
+    _exceptions_queue(exceptions, hash_df(exceptions), style_exceptions_table=style_exceptions_table)
+
+
+# Fragment: changing a queue filter reruns only the queue (mask, sort, table, download),
+# not the pipeline or the other tabs.
+@_fragment
+def _exceptions_queue(
+    exceptions: pd.DataFrame, digest: bytes, *, style_exceptions_table: Optional[Callable[..., Any]]
+) -> None:
+    exceptions, options = _exceptions_queue_view(digest, exceptions)
     fcol1, fcol2, fcol3, fcol4 = st.columns(4)
 
     with fcol1:
-        issue_types = (
-            sorted(exceptions["issue_type"].dropna().unique().tolist()) if "issue_type" in exceptions.columns else []
-        )
+        issue_types = options["issue_type"]
         issue_filter = st.multiselect("Issue types", issue_types, default=issue_types, key="exq_issue_types")
 
     with fcol2:
-        countries = sorted(
-            [
-                c
-                for c in exceptions.get("customer_country", pd.Series([], dtype="object")).dropna().unique().tolist()
-                if str(c).strip() != ""
-            ]
-        )
+        countries = options["customer_country"]
         country_filter = st.multiselect("Customer country", countries, default=countries, key="exq_countries")
 
     with fcol3:
-        suppliers = sorted(
-            [
-                s
-                for s in exceptions.get("supplier_name", pd.Series([], dtype="object")).dropna().unique().tolist()
-                if str(s).strip() != ""
-            ]
-        )
+        suppliers = options["supplier_name"]
         supplier_filter = st.multiselect("Supplier", suppliers, default=suppliers, key="exq_suppliers")
 
     with fcol4:
-        urgencies = ["Critical", "High", "Medium", "Low"]
+        urgencies = _URGENCY_OPTIONS
         urgency_filter = st.multiselect("Urgency", urgencies, default=urgencies, key="exq_urgency")
 
-    filtered = exceptions.copy()
-    if issue_filter and "issue_type" in filtered.columns:
-        filtered = filtered[filtered["issue_type"].isin(issue_filter)]
-    if country_filter and "customer_country" in filtered.columns:
-        filtered = filtered[filtered["customer_country"].isin(country_filter)]
-    if supplier_filter and "supplier_name" in filtered.columns:
-        filtered = filtered[filtered["supplier_name"].isin(supplier_filter)]
-    if urgency_filter and "Urgency" in filtered.columns:
-        filtered = filtered[filtered["Urgency"].isin(urgency_filter)]
-
-    sort_cols = [c for c in ["Urgency", "order_id"] if c in filtered.columns]
-    if sort_cols:
-        filtered = filtered.sort_values(sort_cols, ascending=True)
+    # AND every filter into one boolean mask; only the final .loc materializes rows.
+    # A filter with every option selected (the default) on a column with no values outside
+    # the options excludes nothing, so its isin() is skipped.
+    mask = np.ones(len(exceptions), dtype=bool)
+    for col, selected, all_options in (
+        ("issue_type", issue_filter, issue_types),
+        ("customer_country", country_filter, countries),
+        ("supplier_name", supplier_filter, suppliers),
+        ("Urgency", urgency_filter, urgencies),
+    ):
+        if not selected or col not in exceptions.columns:
+            continue
+        if col in options["_covered"] and len(selected) == len(all_options):
+            continue
+        mask &= exceptions[col].isin(selected).to_numpy()
+    filtered = exceptions if mask.all() else exceptions.loc[mask]  # already in (Urgency, order_id) order
+    selection = tuple(tuple(map(str, f)) for f in (issue_filter, country_filter, supplier_filter, urgency_filter))
 
     preferred_cols = [
         "Urgency",
@@ -265,14 +456,16 @@ def render_exceptions_queue_section(
     ]
     show_cols = [c for c in preferred_cols if c in filtered.columns]
 
-    if callable(style_exceptions_table) and show_cols:
-        st.dataframe(style_exceptions_table(filtered[show_cols]), use_container_width=True, height=420)
-    else:
-        st.dataframe(filtered[show_cols] if show_cols else filtered, use_container_width=True, height=420)
+    _bounded_dataframe(
+        filtered[show_cols] if show_cols else filtered,
+        key="exq_table",
+        height=420,
+        styler=style_exceptions_table if show_cols else None,
+    )
 
     st.download_button(
         "Download Exceptions CSV",
-        data=filtered.to_csv(index=False).encode("utf-8"),
+        data=_queue_csv_bytes(digest, selection, filtered),
         file_name="exceptions_queue.csv",
         mime="text/csv",
         key="dl_exceptions_csv",
@@ -293,6 +486,30 @@ def render_supplier_scorecards(
         st.info("Scorecards require `supplier_name` in your normalized line status data.")
         return
 
+    _scorecard_table(scorecard)
+
+    with st.expander("Trend over time (from saved runs)", expanded=True):
+        _scorecard_trend(ws_root=ws_root, load_recent_scorecard_history=load_recent_scorecard_history, list_runs=list_runs)
+
+
+@st.cache_data(show_spinner=False, max_entries=16, ttl=300)
+def _cached_scorecard_history(
+    ws_root_str: str, max_runs: int, run_paths: tuple, _loader: Callable[..., Any]
+) -> pd.DataFrame:
+    """
+    Trend history re-reads + re-scores every saved run's CSVs. Saved runs don't change, so the
+    set of runs in the window (run_paths, from the list_runs call the trend already makes) is
+    the cache key: a new/deleted run changes it. The TTL bounds staleness for in-place edits.
+    _loader is called through __wrapped__ when it has one: core.scorecards' loader carries its
+    own st.cache_data keyed only on (ws_root, max_runs), which would keep serving the old history.
+    """
+    return getattr(_loader, "__wrapped__", _loader)(ws_root_str, max_runs=max_runs)
+
+
+# Scorecard fragments: the top-N / min-lines controls and the trend controls each rerun
+# only their own block.
+@_fragment
+def _scorecard_table(scorecard: pd.DataFrame) -> None:
     sc1, sc2 = st.columns(2)
     with sc1:
         top_n = st.slider("Show top N suppliers", min_value=5, max_value=50, value=15, step=5, key="scorecard_top_n")
@@ -324,46 +541,54 @@ def render_supplier_scorecards(
 
     st.download_button(
         "Download Supplier Scorecards CSV",
-        data=scorecard.to_csv(index=False).encode("utf-8"),
+        data=df_to_csv_bytes(scorecard),
         file_name="supplier_scorecards.csv",
         mime="text/csv",
         key="dl_scorecards_csv",
     )
 
-    with st.expander("Trend over time (from saved runs)", expanded=True):
-        runs_for_trend = []
-        if callable(list_runs):
-            try:
-                runs_for_trend = list_runs(ws_root)
-            except Exception:
-                runs_for_trend = []
 
-        if not runs_for_trend:
-            st.caption("No saved runs yet. Click **Save this run** to build trend history.")
-            return
+@_fragment
+def _scorecard_trend(
+    *,
+    ws_root: Path,
+    load_recent_scorecard_history: Callable[..., Any],
+    list_runs: Optional[Callable[..., Any]],
+) -> None:
+    runs_for_trend = []
+    if callable(list_runs):
+        try:
+            runs_for_trend = list_runs(ws_root)
+        except Exception:
+            runs_for_trend = []
 
-        max_runs = st.slider("Use last N saved runs", 5, 50, 25, 5, key="trend_max_runs")
-        hist = load_recent_scorecard_history(str(ws_root), max_runs=int(max_runs))
+    if not runs_for_trend:
+        st.caption("No saved runs yet. Click **Save this run** to build trend history.")
+        return
 
-        if hist is None or hist.empty:
-            st.caption("No historical scorecards found yet (save a run first).")
-            return
+    max_runs = st.slider("Use last N saved runs", 5, 50, 25, 5, key="trend_max_runs")
+    run_paths = tuple(str(r.get("path", "")) for r in runs_for_trend[: int(max_runs)] if isinstance(r, dict))
+    hist = _cached_scorecard_history(str(ws_root), int(max_runs), run_paths, load_recent_scorecard_history)
+
+    if hist is None or hist.empty:
+        st.caption("No historical scorecards found yet (save a run first).")
+        return
 
-        supplier_options = sorted(hist["supplier_name"].dropna().unique().tolist())
-        chosen_supplier = st.selectbox("Supplier", supplier_options, key="scorecard_trend_supplier")
+    supplier_options = sorted(hist["supplier_name"].dropna().unique().tolist())
+    chosen_supplier = st.selectbox("Supplier", supplier_options, key="scorecard_trend_supplier")
 
-        s_hist = hist[hist["supplier_name"] == chosen_supplier].copy().sort_values("run_dt")
-        chart_df = s_hist[["run_dt", "exception_rate"]].dropna()
-        if not chart_df.empty:
-            st.line_chart(chart_df.set_index("run_dt"))
+    s_hist = hist[hist["supplier_name"] == chosen_supplier].sort_values("run_dt")
+    chart_df = s_hist[["run_dt", "exception_rate"]].dropna()
+    if not chart_df.empty:
+        st.line_chart(chart_df.set_index("run_dt"))
 
-        tcols = ["run_id", "total_lines", "exception_lines", "exception_rate", "critical", "high"]
-        tcols = [c for c in tcols if c in s_hist.columns]
-        st.dataframe(s_hist[tcols].sort_values("run_id", ascending=False), use_container_width=True, height=220)
+    tcols = ["run_id", "total_lines", "exception_lines", "exception_rate", "critical", "high"]
+    tcols = [c for c in tcols if c in s_hist.columns]
+    st.dataframe(s_hist[tcols].sort_values("run_id", ascending=False), use_container_width=True, height=220)
 
 
 def render_sla_escalations_panel(*, escalations_df: pd.DataFrame) -> None:
     if isinstance(escalations_df, pd.DataFrame) and not escalations_df.empty:
         st.divider()
         st.subheader("SLA Escalations (Supplier-level)")
-        st.dataframe(escalations_df, use_container_width=True, height=260)
+        _bounded_dataframe(escalations_df, key="sla_escalations", height=260)
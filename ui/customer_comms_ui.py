@@ -27,7 +27,14 @@ def render_customer_comms_ui(customer_impact: pd.DataFrame):
     if order_col:
         opts = df[order_col].fillna("").astype(str).tolist()
         chosen = st.selectbox("Select order", opts, key="cust_comms_select_order")
-        row = df[df[order_col].astype(str) == str(chosen)].iloc[0]
+        # Position of the first matching option (C-level list scan) instead of re-casting the
+        # whole column and boolean-indexing on every selection; also matches blank ids, which
+        # the fillna("") options hold but astype(str) would have turned into "nan".
+        try:
+            pos = opts.index(chosen)
+        except ValueError:
+            pos = 0
+        row = df.iloc[pos]
     else:
         chosen = "(customer item)"
         row = df.iloc[0]
@@ -7,7 +7,8 @@ from typing import Tuple
 import pandas as pd
 import streamlit as st
 
-from core.demo_schema import validate_demo_inputs
+from core.demo_schema import ORDERS_DTYPES, SHIPMENTS_DTYPES, TRACKING_DTYPES, validate_demo_inputs
+from ui.app_helpers import read_csv_typed, read_csv_upload
 from ui.demo_fork_ui import render_demo_fork_controls
 
 DEMO_KEYS = {
@@ -22,6 +23,12 @@ DEMO_FILES = {
     "tracking": "raw_tracking.csv",
 }
 
+DEMO_DTYPES = {
+    "orders": ORDERS_DTYPES,
+    "shipments": SHIPMENTS_DTYPES,
+    "tracking": TRACKING_DTYPES,
+}
+
 
 def _demo_mode_active() -> bool:
     # Canonical demo mode written by ui/sidebar.py
@@ -38,6 +45,20 @@ def _infer_data_dir() -> Path:
     return Path(__file__).resolve().parent.parent / "data"
 
 
+@st.cache_data(show_spinner=False)
+def _load_demo_table(path: str, mtime: float, kind: str) -> pd.DataFrame:
+    """
+    Parses a static demo CSV once per process.
+    mtime is part of the cache key so edited files on disk are picked up.
+    st.cache_data hands every caller its own copy, so session edits never leak back.
+    """
+    return read_csv_typed(path, dtype=DEMO_DTYPES.get(kind))
+
+
+def _read_demo_csv(p: Path, kind: str) -> pd.DataFrame:
+    return _load_demo_table(str(p.resolve()), p.stat().st_mtime, kind)
+
+
 def _load_demo_files(data_dir: Path) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     orders_path = data_dir / DEMO_FILES["orders"]
     shipments_path = data_dir / DEMO_FILES["shipments"]
@@ -49,9 +70,9 @@ def _load_demo_files(data_dir: Path) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Dat
             "Missing required demo CSV file(s): " + ", ".join(missing) + f" in {data_dir.as_posix()}"
         )
 
-    o = pd.read_csv(orders_path)
-    s = pd.read_csv(shipments_path)
-    t = pd.read_csv(tracking_path) if tracking_path.exists() else pd.DataFrame()
+    o = _read_demo_csv(orders_path, "orders")
+    s = _read_demo_csv(shipments_path, "shipments")
+    t = _read_demo_csv(tracking_path, "tracking") if tracking_path.exists() else pd.DataFrame()
     return o, s, t
 
 
@@ -70,9 +91,9 @@ def _load_snapshot_raw_csvs(snapshot_dir: Path) -> Tuple[pd.DataFrame, pd.DataFr
             "Snapshot missing required file(s): " + ", ".join(missing) + f" in {snapshot_dir.as_posix()}"
         )
 
-    o = pd.read_csv(orders_path)
-    s = pd.read_csv(shipments_path)
-    t = pd.read_csv(tracking_path) if tracking_path.exists() else pd.DataFrame()
+    o = read_csv_typed(orders_path, dtype=ORDERS_DTYPES)
+    s = read_csv_typed(shipments_path, dtype=SHIPMENTS_DTYPES)
+    t = read_csv_typed(tracking_path, dtype=TRACKING_DTYPES) if tracking_path.exists() else pd.DataFrame()
     return o, s, t
 
 
@@ -314,9 +335,9 @@ def get_active_raw_inputs(
         return raw_orders, raw_shipments, raw_tracking
 
     try:
-        raw_orders = pd.read_csv(f_orders)
-        raw_shipments = pd.read_csv(f_shipments)
-        raw_tracking = pd.read_csv(f_tracking) if f_tracking else pd.DataFrame()
+        raw_orders = read_csv_upload(f_orders, dtype=ORDERS_DTYPES)
+        raw_shipments = read_csv_upload(f_shipments, dtype=SHIPMENTS_DTYPES)
+        raw_tracking = read_csv_upload(f_tracking, dtype=TRACKING_DTYPES) if f_tracking else pd.DataFrame()
         return raw_orders, raw_shipments, raw_tracking
     except Exception as e:
         st.error("Failed to read one of your CSV uploads.")
@@ -1,10 +1,12 @@
 # ui/exceptions_queue_ui.py
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 from core.styling import style_exceptions_table
+from ui.app_helpers import df_to_csv_bytes
 
 
 def render_exceptions_queue(
@@ -92,19 +94,18 @@ def render_exceptions_queue(
     # -------------------------------
     # Apply filters (match app.py)
     # -------------------------------
-    filtered = exceptions.copy()
-
-    if issue_filter and "issue_type" in filtered.columns:
-        filtered = filtered[filtered["issue_type"].isin(issue_filter)]
-
-    if country_filter and "customer_country" in filtered.columns:
-        filtered = filtered[filtered["customer_country"].isin(country_filter)]
-
-    if supplier_filter and "supplier_name" in filtered.columns:
-        filtered = filtered[filtered["supplier_name"].isin(supplier_filter)]
-
-    if urgency_filter and "Urgency" in filtered.columns:
-        filtered = filtered[filtered["Urgency"].isin(urgency_filter)]
+    # One combined row mask, one materialization (instead of a copy + four chained slices)
+    conds = [
+        exceptions[col].isin(selected).to_numpy()
+        for col, selected in (
+            ("issue_type", issue_filter),
+            ("customer_country", country_filter),
+            ("supplier_name", supplier_filter),
+            ("Urgency", urgency_filter),
+        )
+        if selected and col in exceptions.columns
+    ]
+    filtered = exceptions.loc[np.logical_and.reduce(conds)] if conds else exceptions
 
     # -------------------------------
     # Sort + choose columns (match app.py)
@@ -137,7 +138,7 @@ def render_exceptions_queue(
 
     st.download_button(
         "Download Exceptions CSV",
-        data=filtered.to_csv(index=False).encode("utf-8"),
+        data=df_to_csv_bytes(filtered),
         file_name="exceptions_queue.csv",
         mime="text/csv",
         key=f"{key_prefix}_dl_exceptions_csv",
@@ -1,6 +1,7 @@
 # ui/issue_tracker_ui.py
 from __future__ import annotations
 
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -13,18 +14,28 @@ from core.issue_tracker import IssueTrackerStore
 ISSUE_STATUSES = ["Open", "Waiting", "Resolved"]
 
 
-def _get_store(issue_tracker_path: Optional[Path] = None) -> IssueTrackerStore:
-    """
-    Ensures we always use the per-tenant store file when provided.
-    Falls back to IssueTrackerStore() default behavior if no path is given.
-    """
+@st.cache_resource(show_spinner=False)
+def _cached_store(issue_tracker_path_str: str) -> IssueTrackerStore:
+    # The store holds its path plus an mtime-keyed read snapshot (mutations always re-read JSON),
+    # so one instance per file is safe to share; constructing it runs the migration pass once.
     try:
-        return IssueTrackerStore(issue_tracker_path) if issue_tracker_path else IssueTrackerStore()
+        return IssueTrackerStore(issue_tracker_path_str) if issue_tracker_path_str else IssueTrackerStore()
     except TypeError:
         # Backward compatibility if IssueTrackerStore() signature differs
         return IssueTrackerStore()
 
 
+def get_issue_tracker_store(issue_tracker_path: Optional[Path] = None) -> IssueTrackerStore:
+    """
+    Ensures we always use the per-tenant store file when provided.
+    Falls back to IssueTrackerStore() default behavior if no path is given.
+    """
+    return _cached_store(str(issue_tracker_path) if issue_tracker_path else "")
+
+
+_get_store = get_issue_tracker_store
+
+
 def _row_context(r: pd.Series) -> Dict[str, Any]:
     """
     Best-effort context extraction for timeline + filtering.
@@ -55,6 +66,12 @@ def _row_context(r: pd.Series) -> Dict[str, Any]:
     return ctx
 
 
+def _timeline_batch(store):
+    """One timeline write for a bulk save loop (no-op for stores without batching)."""
+    batch = getattr(store, "timeline_batch", None)
+    return batch() if callable(batch) else nullcontext()
+
+
 def derive_followups_open(
     followups_full: pd.DataFrame,
     issue_tracker_path: Optional[Path] = None,
@@ -70,13 +87,15 @@ def derive_followups_open(
         return followups_full
 
     store = _get_store(issue_tracker_path)
-    issue_map = store.load() or {}
+    issue_map = store.snapshot() or {}
 
-    df = followups_full.copy()
-    df["issue_id"] = df["issue_id"].astype(str)
+    issue_ids = followups_full["issue_id"].astype(str)
+    resolved = issue_ids.map(lambda k: bool((issue_map.get(k, {}) or {}).get("resolved", False)))
 
-    resolved = df["issue_id"].map(lambda k: bool((issue_map.get(str(k), {}) or {}).get("resolved", False)))
-    df = df[resolved == False].copy()  # noqa: E712
+    # Filter first, then one copy of the surviving rows (the only frame we write to)
+    keep = ~resolved.to_numpy(dtype=bool)
+    df = followups_full.loc[keep].copy()
+    df["issue_id"] = issue_ids.to_numpy()[keep]
     return df
 
 
@@ -98,7 +117,7 @@ def enrich_followups_with_contact_fields(
         return followups_df
 
     store = _get_store(issue_tracker_path)
-    issue_map = store.load() or {}
+    issue_map = store.snapshot() or {}
 
     df = followups_df.copy()
     df["issue_id"] = df["issue_id"].astype(str)
@@ -140,7 +159,7 @@ def enrich_followups_with_issue_fields(
         return followups_df
 
     store = _get_store(issue_tracker_path)
-    issue_map = store.load() or {}
+    issue_map = store.snapshot() or {}
 
     df = followups_df.copy()
     df["issue_id"] = df["issue_id"].astype(str)
@@ -306,48 +325,49 @@ def render_issue_ownership_panel(
         with c1:
             if st.button("💾 Save assignments", use_container_width=True, key=f"{key_prefix}_btn_save"):
                 try:
-                    for _, r in edited.iterrows():
-                        iid = str(r.get("issue_id", "")).strip()
-                        if not iid:
-                            continue
+                    with _timeline_batch(store):
+                        for _, r in edited.iterrows():
+                            iid = str(r.get("issue_id", "")).strip()
+                            if not iid:
+                                continue
 
-                        ctx = _row_context(r)
+                            ctx = _row_context(r)
 
-                        owner = str(r.get("owner", "") or "").strip()
-                        status = str(r.get("issue_status", "") or "").strip()
-                        next_action = str(r.get("next_action_at", "") or "").strip()
+                            owner = str(r.get("owner", "") or "").strip()
+                            status = str(r.get("issue_status", "") or "").strip()
+                            next_action = str(r.get("next_action_at", "") or "").strip()
 
-                        if owner:
-                            try:
-                                store.set_owner(iid, owner, context=ctx)
-                            except Exception:
+                            if owner:
                                 try:
-                                    store.set_owner(iid, owner)
+                                    store.set_owner(iid, owner, context=ctx)
                                 except Exception:
-                                    pass
+                                    try:
+                                        store.set_owner(iid, owner)
+                                    except Exception:
+                                        pass
 
-                        if status in ISSUE_STATUSES:
-                            try:
-                                store.set_issue_status(iid, status, context=ctx)
-                            except Exception:
+                            if status in ISSUE_STATUSES:
                                 try:
-                                    store.set_issue_status(iid, status)
+                                    store.set_issue_status(iid, status, context=ctx)
                                 except Exception:
-                                    # fallback: map resolved to old method
-                                    if status == "Resolved":
-                                        try:
-                                            store.set_resolved(iid, True)
-                                        except Exception:
-                                            pass
-
-                        if next_action:
-                            try:
-                                store.set_next_action_at(iid, next_action, context=ctx)
-                            except Exception:
+                                    try:
+                                        store.set_issue_status(iid, status)
+                                    except Exception:
+                                        # fallback: map resolved to old method
+                                        if status == "Resolved":
+                                            try:
+                                                store.set_resolved(iid, True)
+                                            except Exception:
+                                                pass
+
+                            if next_action:
                                 try:
-                                    store.set_next_action_at(iid, next_action)
+                                    store.set_next_action_at(iid, next_action, context=ctx)
                                 except Exception:
-                                    pass
+                                    try:
+                                        store.set_next_action_at(iid, next_action)
+                                    except Exception:
+                                        pass
 
                     st.success("Saved ✅")
                     st.rerun()
@@ -472,7 +492,7 @@ def render_issue_tracker_panel(
         return followups_full
 
     store = _get_store(issue_tracker_path)
-    issue_map = store.load() or {}
+    issue_map = store.snapshot() or {}
 
     df = followups_full.copy()
     df["issue_id"] = df["issue_id"].astype(str)
@@ -528,25 +548,26 @@ def render_issue_tracker_panel(
         with save1:
             if st.button("💾 Save changes", use_container_width=True, key=f"{key_prefix}_btn_save"):
                 try:
-                    for _, r in edited.iterrows():
-                        iid = str(r.get("issue_id", "")).strip()
-                        if not iid:
-                            continue
-                        ctx = _row_context(r)
+                    with _timeline_batch(store):
+                        for _, r in edited.iterrows():
+                            iid = str(r.get("issue_id", "")).strip()
+                            if not iid:
+                                continue
+                            ctx = _row_context(r)
 
-                        try:
-                            store.upsert(
-                                issue_id=iid,
-                                resolved=bool(r.get("resolved", False)),
-                                notes=str(r.get("notes", "") or ""),
-                                context=ctx,
-                            )
-                        except Exception:
-                            store.upsert(
-                                issue_id=iid,
-                                resolved=bool(r.get("resolved", False)),
-                                notes=str(r.get("notes", "") or ""),
-                            )
+                            try:
+                                store.upsert(
+                                    issue_id=iid,
+                                    resolved=bool(r.get("resolved", False)),
+                                    notes=str(r.get("notes", "") or ""),
+                                    context=ctx,
+                                )
+                            except Exception:
+                                store.upsert(
+                                    issue_id=iid,
+                                    resolved=bool(r.get("resolved", False)),
+                                    notes=str(r.get("notes", "") or ""),
+                                )
 
                     st.success("Saved ✅")
                     st.rerun()
@@ -558,7 +579,7 @@ def render_issue_tracker_panel(
             st.caption("Tip: Use this to hide resolved items from OPEN follow-ups while keeping history.")
 
     # Merge latest state back into df (covers same-run edits)
-    latest_map = store.load() or {}
+    latest_map = store.snapshot() or {}
     df["resolved"] = df["issue_id"].map(lambda k: bool((latest_map.get(str(k), {}) or {}).get("resolved", False)))
     df["notes"] = df["issue_id"].map(lambda k: str((latest_map.get(str(k), {}) or {}).get("notes", "")))
     return df
@@ -601,12 +622,17 @@ def apply_issue_tracker(
         issue_tracker_path=issue_tracker_path,
     )
 
-    # Combine both (safe even if one side no-ops)
-    followups_open_enriched = followups_open_with_issue.copy()
+    # Combine both (safe even if one side no-ops). assign() builds the new frame only when
+    # there is something to add; otherwise the issue-enriched frame is returned as-is.
+    followups_open_enriched = followups_open_with_issue
     try:
-        for col in ["contact_status", "follow_up_count"]:
-            if col in followups_open_with_contact.columns and col not in followups_open_enriched.columns:
-                followups_open_enriched[col] = followups_open_with_contact[col].values
+        extra = {
+            col: followups_open_with_contact[col].values
+            for col in ["contact_status", "follow_up_count"]
+            if col in followups_open_with_contact.columns and col not in followups_open_with_issue.columns
+        }
+        if extra:
+            followups_open_enriched = followups_open_with_issue.assign(**extra)
     except Exception:
         pass
 
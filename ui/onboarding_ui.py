@@ -9,6 +9,11 @@ def render_onboarding_checklist(
     title: str = "ClearOps onboarding checklist (14 steps)",
     expanded: bool = True,
 ) -> None:
+    # Once hidden, skip the whole block for the rest of the session (no markdown per rerun).
+    # A plain session flag (not the checkbox key) so it survives the checkbox no longer rendering.
+    if st.session_state.get("onboarding_hidden"):
+        return
+
     with st.expander(title, expanded=expanded):
         st.markdown(
             """
@@ -28,3 +33,13 @@ def render_onboarding_checklist(
 14. Use **Ops Outreach (Comms)**, then **Save Run** to build trends and history
             """.strip()
         )
+        st.checkbox(
+            "Hide this checklist",
+            value=False,
+            key="onboarding_hide_checkbox",
+            on_change=_hide_onboarding,
+        )
+
+
+def _hide_onboarding() -> None:
+    st.session_state["onboarding_hidden"] = True
@@ -7,6 +7,7 @@ import pandas as pd
 import streamlit as st
 
 from core.scorecards import load_recent_scorecard_history
+from ui.app_helpers import df_to_csv_bytes
 
 
 def render_supplier_scorecards(
@@ -60,7 +61,7 @@ def render_supplier_scorecards(
 
     st.download_button(
         "Download Supplier Scorecards CSV",
-        data=scorecard.to_csv(index=False).encode("utf-8"),
+        data=df_to_csv_bytes(scorecard),
         file_name="supplier_scorecards.csv",
         mime="text/csv",
         key=f"{key_prefix}_dl_scorecards_csv",
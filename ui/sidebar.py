@@ -6,7 +6,8 @@ from pathlib import Path
 import pandas as pd
 import streamlit as st
 
-from core.suppliers import load_suppliers, save_suppliers
+from core.suppliers import SUPPLIERS_DTYPES, load_suppliers, save_suppliers, suppliers_path
+from ui.app_helpers import read_csv_typed
 from ui.demo_health import render_demo_health_badge
 
 # Best-effort import: sidebar can pre-load demo state so the health badge is accurate
@@ -16,6 +17,23 @@ except Exception:
     ensure_demo_state = None
 
 
+def _file_mtime_ns(p: Path):
+    try:
+        return p.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_suppliers(suppliers_dir_str: str, account_id: str, store_id: str, mtime_ns) -> pd.DataFrame:
+    """
+    One parsed Supplier Directory per (tenant, file mtime) for the whole process.
+    st.cache_data hands each caller its own copy: the frame lands in session_state and is
+    passed on to views/workspaces, so it must not be shared across sessions.
+    """
+    return load_suppliers(Path(suppliers_dir_str), account_id, store_id)
+
+
 def render_sidebar_context(
     data_dir: Path,
     workspaces_dir: Path,
@@ -141,9 +159,13 @@ def render_sidebar_context(
         cache_tenant_key = f"{key_prefix}_suppliers_df_cache_tenant"
 
         cur_tenant = f"{account_id}::{store_id}"
-        if st.session_state.get(cache_tenant_key) != cur_tenant:
-            st.session_state[cache_tenant_key] = cur_tenant
-            st.session_state[cache_key] = load_suppliers(suppliers_dir, account_id, store_id)
+        # Re-read only when the tenant or the file on disk changed (one stat per rerun)
+        suppliers_sig = (cur_tenant, _file_mtime_ns(suppliers_path(suppliers_dir, account_id, store_id)))
+        if st.session_state.get(cache_tenant_key) != suppliers_sig:
+            st.session_state[cache_tenant_key] = suppliers_sig
+            st.session_state[cache_key] = _cached_suppliers(
+                str(suppliers_dir), account_id, store_id, suppliers_sig[1]
+            )
 
         f_suppliers = st.file_uploader(
             "Upload suppliers.csv",
@@ -151,14 +173,26 @@ def render_sidebar_context(
             key=f"{key_prefix}_suppliers_uploader",
         )
         if f_suppliers is not None:
-            try:
-                uploaded_suppliers = pd.read_csv(f_suppliers)
-                st.session_state[cache_key] = uploaded_suppliers
-                p = save_suppliers(suppliers_dir, account_id, store_id, uploaded_suppliers)
-                st.success(f"Saved ✅ {p.as_posix()}")
-            except Exception as e:
-                st.error("Failed to read suppliers CSV.")
-                st.code(str(e))
+            # The uploader keeps its file across reruns; only parse + save when the upload (or tenant) changes
+            token_key = f"{key_prefix}_suppliers_upload_token"
+            token = (
+                getattr(f_suppliers, "file_id", None),
+                getattr(f_suppliers, "name", ""),
+                getattr(f_suppliers, "size", None),
+                cur_tenant,
+            )
+            if st.session_state.get(token_key) != token:
+                try:
+                    uploaded_suppliers = read_csv_typed(f_suppliers, dtype=SUPPLIERS_DTYPES)
+                    st.session_state[cache_key] = uploaded_suppliers
+                    p = save_suppliers(suppliers_dir, account_id, store_id, uploaded_suppliers)
+                    st.session_state[token_key] = token
+                    # The upload is already in memory; don't re-read the file we just wrote
+                    st.session_state[cache_tenant_key] = (cur_tenant, _file_mtime_ns(p))
+                    st.success(f"Saved ✅ {p.as_posix()}")
+                except Exception as e:
+                    st.error("Failed to read suppliers CSV.")
+                    st.code(str(e))
 
         with st.expander("View Supplier Directory", expanded=False):
             suppliers_df_preview = st.session_state.get(cache_key, pd.DataFrame())
@@ -176,14 +210,8 @@ def render_sidebar_context(
                     height=220,
                 )
                 if "supplier_email" in suppliers_df_preview.columns:
-                    missing_emails = (
-                        suppliers_df_preview["supplier_email"]
-                        .fillna("")
-                        .astype(str)
-                        .str.strip()
-                        .eq("")
-                        .sum()
-                    )
+                    emails = suppliers_df_preview["supplier_email"]
+                    missing_emails = (emails.isna() | emails.astype("string").str.strip().eq("")).sum()
                     st.caption(f"Missing supplier_email: {int(missing_emails)} row(s)")
 
         st.caption("Tip: Upload suppliers.csv once per account/store to auto-fill follow-ups.")
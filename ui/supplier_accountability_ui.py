@@ -7,6 +7,8 @@ from typing import Optional
 import pandas as pd
 import streamlit as st
 
+from ui.app_helpers import df_to_csv_bytes
+
 
 def render_supplier_accountability(
     accountability: pd.DataFrame | None,
@@ -102,7 +104,7 @@ def render_supplier_accountability(
 
     # ---- Download CSV
     try:
-        csv_bytes = df.to_csv(index=False).encode("utf-8")
+        csv_bytes = df_to_csv_bytes(df)
         st.download_button(
             "Download supplier accountability CSV",
             data=csv_bytes,
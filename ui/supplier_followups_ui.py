@@ -8,18 +8,31 @@ import pandas as pd
 import streamlit as st
 
 from core.styling import copy_button
-from core.issue_tracker import IssueTrackerStore
+from ui.app_helpers import accepted_params, mailto_fallback as _mailto_fallback
 from ui.issue_tracker_ui import (
     enrich_followups_with_contact_fields,
     enrich_followups_with_issue_fields,
+    get_issue_tracker_store,
 )
 
 ISSUE_STATUSES = ["Open", "Waiting", "Resolved"]
 
-
-def _mailto_fallback(to: str, subject: str, body: str) -> str:
-    from urllib.parse import quote
-    return f"mailto:{quote(to or '')}?subject={quote(subject or '')}&body={quote(body or '')}"
+# Preview table columns (display order); intersected with what the frame actually has
+_FOLLOWUP_SUMMARY_COLS = pd.Index(
+    [
+        "supplier_name",
+        "supplier_email",
+        "worst_escalation",
+        "urgency",
+        "item_count",
+        "order_ids",
+        "owner",
+        "issue_status",
+        "next_action_at",
+        "contact_status",
+        "follow_up_count",
+    ]
+)
 
 
 def _first_row_for_supplier(df: pd.DataFrame, supplier_name: str) -> dict:
@@ -80,24 +93,8 @@ def render_supplier_followups_tab(
     except Exception:
         pass
 
-    summary_cols = [
-        c
-        for c in [
-            "supplier_name",
-            "supplier_email",
-            "worst_escalation",
-            "urgency",
-            "item_count",
-            "order_ids",
-            "owner",
-            "issue_status",
-            "next_action_at",
-            "contact_status",
-            "follow_up_count",
-        ]
-        if c in show_df.columns
-    ]
-    st.dataframe(show_df[summary_cols] if summary_cols else show_df, use_container_width=True, height=220)
+    summary_cols = _FOLLOWUP_SUMMARY_COLS.intersection(show_df.columns, sort=False)
+    st.dataframe(show_df[summary_cols] if len(summary_cols) else show_df, use_container_width=True, height=220)
 
     # ----------------------------
     # Supplier selection
@@ -186,7 +183,7 @@ def render_supplier_followups_tab(
     # ----------------------------
     # One-click compose + Follow-up tracking
     # ----------------------------
-    store = IssueTrackerStore(issue_tracker_path)
+    store = get_issue_tracker_store(issue_tracker_path)
 
     issue_ids: list[str] = []
     if "issue_id" in followups_open.columns:
@@ -346,10 +343,7 @@ def render_supplier_followups_tab(
         st.divider()
         st.markdown("#### Supplier Accountability (Auto)")
         try:
-            import inspect
-
-            sig = inspect.signature(build_supplier_accountability_view)
-            params = list(sig.parameters.keys())
+            params = accepted_params(build_supplier_accountability_view)
 
             if "scorecard" in params:
                 accountability = build_supplier_accountability_view(scorecard=scorecard, top_n=10)
@@ -7,9 +7,7 @@ import zipfile
 import pandas as pd
 import streamlit as st
 
-
-def _df_to_csv_bytes(df: pd.DataFrame) -> bytes:
-    return df.to_csv(index=False).encode("utf-8")
+from ui.app_helpers import df_to_csv_bytes
 
 
 def _zip_bytes(files: dict[str, bytes]) -> bytes:
@@ -93,7 +91,7 @@ def render_template_downloads(
         with t1:
             st.download_button(
                 "Shipments template CSV",
-                data=_df_to_csv_bytes(shipments_template),
+                data=df_to_csv_bytes(shipments_template),
                 file_name="shipments_template.csv",
                 mime="text/csv",
                 key=f"{key_prefix}_shipments",
@@ -104,7 +102,7 @@ def render_template_downloads(
         with t2:
             st.download_button(
                 "Tracking template CSV",
-                data=_df_to_csv_bytes(tracking_template),
+                data=df_to_csv_bytes(tracking_template),
                 file_name="tracking_template.csv",
                 mime="text/csv",
                 key=f"{key_prefix}_tracking",
@@ -115,7 +113,7 @@ def render_template_downloads(
         with t3:
             st.download_button(
                 "Suppliers template CSV",
-                data=_df_to_csv_bytes(suppliers_template),
+                data=df_to_csv_bytes(suppliers_template),
                 file_name="suppliers_template.csv",
                 mime="text/csv",
                 key=f"{key_prefix}_suppliers",
@@ -128,9 +126,9 @@ def render_template_downloads(
         # ----------------------------
         zip_data = _zip_bytes(
             {
-                "shipments_template.csv": _df_to_csv_bytes(shipments_template),
-                "tracking_template.csv": _df_to_csv_bytes(tracking_template),
-                "suppliers_template.csv": _df_to_csv_bytes(suppliers_template),
+                "shipments_template.csv": df_to_csv_bytes(shipments_template),
+                "tracking_template.csv": df_to_csv_bytes(tracking_template),
+                "suppliers_template.csv": df_to_csv_bytes(suppliers_template),
                 "README.txt": (
                     "ClearOps — Template Pack\n\n"
                     "Purpose:\n"
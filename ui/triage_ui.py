@@ -1,15 +1,18 @@
 # ui/triage_ui.py
 from __future__ import annotations
 
+from typing import Any
+
 import pandas as pd
 import streamlit as st
 
 from core.styling import style_exceptions_table
+from ui.app_views import render_ops_pack_download
 
 
 def render_ops_triage(
     exceptions: pd.DataFrame,
-    ops_pack_bytes: bytes,
+    ops_pack_bytes: Any,
     pack_name: str,
     *,
     key_prefix: str = "triage",
@@ -140,11 +143,5 @@ def render_ops_triage(
         height=320,
     )
 
-    # --- download ops pack zip ---
-    st.download_button(
-        "⬇️ Download Daily Ops Pack ZIP",
-        data=ops_pack_bytes,
-        file_name=pack_name,
-        mime="application/zip",
-        key=f"{key_prefix}_dl_ops_pack",
-    )
+    # --- download ops pack zip (bytes, or a lazy builder run on "Prepare") ---
+    render_ops_pack_download(ops_pack_bytes, pack_name, key_prefix=key_prefix)
@@ -1,6 +1,7 @@
 # ui/workspaces_ui.py
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -38,6 +39,34 @@ class WorkspacesResult:
     suppliers_df: Optional[pd.DataFrame] = None
 
 
+def _run_dir_signature(run_dir: Path) -> tuple[int, int]:
+    """
+    (file count, newest mtime_ns) for everything under run_dir.
+    Walks with os.scandir so each entry costs at most one stat.
+    """
+    count = 0
+    newest = 0
+    stack = [str(run_dir)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        count += 1
+                        newest = max(newest, entry.stat().st_mtime_ns)
+        except OSError:
+            continue
+    return count, newest
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_run_zip_bytes(run_dir_str: str, signature: tuple[int, int]) -> bytes:
+    # signature is only part of the cache key: the zip is rebuilt when files change
+    return make_run_zip_bytes(Path(run_dir_str))
+
+
 def _is_raw_snapshot_run(run: dict) -> bool:
     """
     Best-effort detection for demo RAW snapshot runs.
@@ -320,7 +349,7 @@ def render_workspaces_sidebar(
                 loaded_path = st.session_state.get(loaded_key)
                 if loaded_path:
                     run_dir = Path(loaded_path)
-                    zip_bytes = make_run_zip_bytes(run_dir)
+                    zip_bytes = _cached_run_zip_bytes(str(run_dir), _run_dir_signature(run_dir))
                     st.download_button(
                         "⬇️ Run Pack",
                         data=zip_bytes,